@@ -97,6 +97,12 @@ def create_app():
         from app.utils.migrate_ss_wage_base import migrate_ss_wage_base
         migrate_ss_wage_base(app)
         
+        from app.utils.migrate_vest_price_cache import migrate_vest_price_cache
+        migrate_vest_price_cache(app)
+        
+        from app.utils.migrate_vest_indexes import migrate_vest_indexes
+        migrate_vest_indexes(app)
+        
         from app.models.user import User
         from app.utils.init_db import init_admin_user
         init_admin_user()
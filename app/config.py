@@ -112,6 +112,13 @@ class ProductionConfig(Config):
     
     # Stricter session timeout
     PERMANENT_SESSION_LIFETIME = 1800  # 30 minutes
+    
+    # Keep a warm connection pool - vest pages issue many short queries
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        **Config.SQLALCHEMY_ENGINE_OPTIONS,
+        'pool_size': int(os.getenv('DB_POOL_SIZE', 10)),
+        'max_overflow': int(os.getenv('DB_MAX_OVERFLOW', 10)),
+    }
 
 
 class DevelopmentConfig(Config):
@@ -5,8 +5,11 @@ Grant model for stock compensation grants.
 from app import db
 from datetime import datetime
 from enum import Enum
+import logging
 from app.utils.price_utils import get_latest_user_price
 
+logger = logging.getLogger(__name__)
+
 
 class GrantType(str, Enum):
     """Types of grants available."""
@@ -26,6 +29,13 @@ class ShareType(str, Enum):
     CASH = "cash"
 
 
+# Share types taxed as options (spread over strike) rather than full value
+ISO_SHARE_TYPES = frozenset((ShareType.ISO_5Y.value, ShareType.ISO_6Y.value))
+
+# Purchase-plan grant types: vest immediately and are taxed at purchase
+ESPP_GRANT_TYPES = frozenset((GrantType.ESPP.value, GrantType.NQESPP.value))
+
+
 class BonusType(str, Enum):
     """Bonus payout types."""
     SHORT_TERM = "short_term"
@@ -75,14 +85,11 @@ class Grant(db.Model):
         For RSUs/RSAs: returns shares × price at grant
         For CASH: returns the cash amount (share_quantity represents USD amount)
         """
-        import logging
-        logger = logging.getLogger(__name__)
-
         if self.share_type == ShareType.CASH.value:
             logger.debug(f"Cash Total Value at Grant: {self.share_quantity}")
             return self.share_quantity
 
-        if self.share_type in [ShareType.ISO_5Y.value, ShareType.ISO_6Y.value]:
+        if self.share_type in ISO_SHARE_TYPES:
             logger.debug("ISO Total Value at Grant: 0.0")
             return 0.0
 
@@ -109,15 +116,12 @@ class Grant(db.Model):
         For ISOs: strike price
         For RSUs/Cash: $0 (granted, not purchased)
         """
-        import logging
-        logger = logging.getLogger(__name__)
-
         if self.grant_type == GrantType.ESPP.value and self.espp_discount:
             cost_basis = self.share_price_at_grant * (1 - self.espp_discount)
             logger.debug(f"ESPP Actual Cost Basis: {cost_basis}")
             return cost_basis
 
-        if self.grant_type == GrantType.NQESPP.value or self.share_type in [ShareType.ISO_5Y.value, ShareType.ISO_6Y.value]:
+        if self.grant_type == GrantType.NQESPP.value or self.share_type in ISO_SHARE_TYPES:
             logger.debug(f"ISO/NQESPP Actual Cost Basis: {self.share_price_at_grant}")
             return self.share_price_at_grant
 
@@ -150,7 +154,7 @@ class Grant(db.Model):
         current_price = self.current_share_price
         
         # For ISOs, calculate the spread (current price - strike price)
-        if self.share_type in [ShareType.ISO_5Y.value, ShareType.ISO_6Y.value]:
+        if self.share_type in ISO_SHARE_TYPES:
             spread = current_price - self.share_price_at_grant
             return self.share_quantity * spread
         
@@ -4,6 +4,7 @@ Records actual sales of vested shares.
 """
 
 from app import db
+from app.models.user import User
 from datetime import datetime
 
 
@@ -94,8 +95,6 @@ class StockSale(db.Model):
         Returns:
             dict with estimated tax breakdown
         """
-        from app.models.user import User
-        
         # Get user and their tax preferences
         user = User.query.get(self.user_id)
         if not user:
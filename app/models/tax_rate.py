@@ -96,6 +96,15 @@ class UserTaxProfile(db.Model):
             # Default rates if no income specified
             return {'federal': 0.22, 'state': 0.093, 'ltcg': 0.15}
         
+        # Bracket lookups are 3+ queries; vests of one year share the result.
+        # Key on the profile fields too so edits to this instance aren't masked.
+        cache_key = (tax_year, income_to_use, self.state, self.filing_status)
+        rate_cache = getattr(self, '_rate_cache', None)
+        if rate_cache is None:
+            rate_cache = self._rate_cache = {}
+        if cache_key in rate_cache:
+            return dict(rate_cache[cache_key])
+        
         # Temporarily set income for bracket lookups
         original_income = self.annual_income
         self.annual_income = income_to_use
@@ -114,11 +123,13 @@ class UserTaxProfile(db.Model):
         # Restore original income
         self.annual_income = original_income
         
-        return {
+        rates = {
             'federal': federal_rate,
             'state': state_rate,
             'ltcg': ltcg_rate
         }
+        rate_cache[cache_key] = rates
+        return dict(rates)
     
     def get_effective_tax_rates(self, total_annual_income: float, tax_year: int) -> dict:
         """
@@ -7,8 +7,14 @@ from app import db
 from flask_login import UserMixin
 from werkzeug.security import generate_password_hash, check_password_hash
 from datetime import datetime
+import logging
 import secrets
 
+logger = logging.getLogger(__name__)
+
+# Werkzeug hashing method for stored passwords (also used for auth's dummy hash)
+PASSWORD_HASH_METHOD = 'pbkdf2:sha256:600000'
+
 
 class User(UserMixin, db.Model):
     """User model for authentication with enhanced security."""
@@ -64,7 +70,7 @@ class User(UserMixin, db.Model):
         Hash and set the user's password.
         Also updates last_password_change timestamp.
         """
-        self.password_hash = generate_password_hash(password, method='pbkdf2:sha256:600000')
+        self.password_hash = generate_password_hash(password, method=PASSWORD_HASH_METHOD)
         self.last_password_change = datetime.utcnow()
     
     def check_password(self, password: str) -> bool:
@@ -139,14 +145,10 @@ class User(UserMixin, db.Model):
                 user_key = decrypt_with_master(self.encrypted_user_key)
                 return user_key
             except Exception as e:
-                import logging
-                logger = logging.getLogger(__name__)
                 logger.error(f"Failed to decrypt encrypted_user_key for user {self.id}: {e}", exc_info=True)
                 # fall through to regenerate
 
         # generate new user key and store encrypted
-        import logging
-        logger = logging.getLogger(__name__)
         logger.warning(f"Generating new encryption key for user {self.id}")
         user_key = generate_user_key()
         self.encrypted_user_key = encrypt_with_master(user_key)
@@ -4,6 +4,10 @@ from datetime import datetime
 
 class UserPrice(db.Model):
     __tablename__ = 'user_prices'
+    __table_args__ = (
+        # As-of lookups: latest price for a user on or before a date
+        db.Index('ix_user_prices_user_date', 'user_id', 'valuation_date'),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
@@ -3,14 +3,167 @@ Vest event model for tracking individual vesting events.
 """
 
 from app import db
-from datetime import datetime, date
+from datetime import datetime, date, timezone
+from bisect import bisect_right
+from typing import NamedTuple, Optional
+import logging
+from flask import g, has_app_context
+from sqlalchemy.orm import contains_eager, joinedload
+from app.models.grant import Grant, ShareType, GrantType, ESPP_GRANT_TYPES
+from app.models.user_price import UserPrice
 from app.utils.price_utils import get_latest_user_price
+from app.utils.encryption import decrypt_for_user_cached
+from app.utils.tax_math import tax_breakdown_core, compute_tax_breakdowns, sale_tax_core
+from app.utils.vest_math import compute_vest_values
+
+logger = logging.getLogger(__name__)
+
+
+class SaleTaxEstimate(NamedTuple):
+    """Capital gains projection for a vest's remaining shares, from VestEvent.get_estimated_sale_tax()."""
+    shares_held: float
+    cost_basis_per_share: float
+    cost_basis: float
+    current_value: float
+    unrealized_gain: float
+    days_held: int
+    is_long_term: bool
+    holding_period: str
+    estimated_tax: float
+    federal_tax: float
+    niit_tax: float
+    state_tax: float
+    federal_rate: float
+    state_rate: float
+    method: str
+
+
+class VestData(NamedTuple):
+    """Everything the vest detail page shows, as returned by VestEvent.get_complete_data()."""
+    # Basic info
+    vest_id: int
+    vest_date: Optional[date]
+    has_vested: bool
+    is_iso: bool
+    is_cash: bool
+    grant_type: Optional[str]
+    share_type: Optional[str]
+    
+    # Shares
+    shares_vested: float
+    shares_withheld_for_taxes: float
+    shares_received: float
+    shares_sold: float
+    shares_exercised: float
+    shares_remaining: float
+    
+    # Prices
+    price_at_vest: float
+    current_price: float
+    strike_price: Optional[float]  # None for non-ISOs
+    cost_basis_per_share: float
+    
+    # Values
+    gross_value: float
+    tax_withheld_value: float
+    net_value: float
+    current_market_value: float
+    total_cost_basis: float
+    unrealized_gain: float
+    
+    # Tax payment method
+    cash_paid: float
+    cash_covered_all: bool
+    
+    # Tax calculations
+    tax_breakdown: Optional[dict]  # Vest tax breakdown
+    sale_tax_projection: Optional[SaleTaxEstimate]  # Capital gains projection
+    
+    # Metadata
+    notes: Optional[str]
+    needs_tax_info: bool
+    error: Optional[str] = None  # Set when calculations failed and values are zeroed
+
+
+# Zeroed result for get_complete_data's error path; per-vest fields are set with _replace()
+_EMPTY_VEST_DATA = VestData(
+    vest_id=None, vest_date=None, has_vested=False, is_iso=False, is_cash=False,
+    grant_type=None, share_type=None,
+    shares_vested=0.0, shares_withheld_for_taxes=0.0, shares_received=0.0,
+    shares_sold=0.0, shares_exercised=0.0, shares_remaining=0.0,
+    price_at_vest=0.0, current_price=0.0, strike_price=None, cost_basis_per_share=0.0,
+    gross_value=0.0, tax_withheld_value=0.0, net_value=0.0,
+    current_market_value=0.0, total_cost_basis=0.0, unrealized_gain=0.0,
+    cash_paid=0.0, cash_covered_all=False,
+    tax_breakdown=None, sale_tax_projection=None,
+    notes='', needs_tax_info=False,
+)
+
+# (is_cash, is_iso) by share type; anything not listed (RSU, ESPP shares) is neither
+_SHARE_TYPE_FLAGS = {
+    ShareType.CASH.value: (True, False),
+    ShareType.ISO_5Y.value: (False, True),
+    ShareType.ISO_6Y.value: (False, True),
+}
+_DEFAULT_TYPE_FLAGS = (False, False)
+
+
+def _today() -> date:
+    """Today's date, read once per request (cached on flask.g)."""
+    if not has_app_context():
+        return date.today()
+    today = g.get('_vest_today')
+    if today is None:
+        today = g._vest_today = date.today()
+    return today
+
+
+# days_held -> display string; the set of distinct holding periods is small
+_HOLDING_PERIOD_STRINGS = {}
+
+
+def _format_holding_period(days_held: int) -> str:
+    """Holding period as "2y 45d" (a year or more) or "180d"."""
+    text = _HOLDING_PERIOD_STRINGS.get(days_held)
+    if text is None:
+        years, days = divmod(days_held, 365)
+        text = f"{years}y {days}d" if years else f"{days}d"
+        _HOLDING_PERIOD_STRINGS[days_held] = text
+    return text
+
+
+def _utcnow() -> datetime:
+    """Current UTC time as a naive datetime (matches the DateTime columns)."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _get_user_tax_prefs(user) -> dict:
+    """
+    Return the user's simple tax preferences, cached on flask.g for the request.
+    
+    Dict has the keys from User.get_tax_rates() (federal, state, fica, total)
+    plus include_fica and ss_wage_base_maxed.
+    """
+    cache = g.setdefault('_vest_tax_prefs', {}) if has_app_context() else {}
+    prefs = cache.get(user.id)
+    if prefs is None:
+        prefs = user.get_tax_rates()
+        prefs['include_fica'] = user.include_fica if user.include_fica is not None else True
+        prefs['ss_wage_base_maxed'] = user.ss_wage_base_maxed if user.ss_wage_base_maxed is not None else False
+        cache[user.id] = prefs
+    return prefs
 
 
 class VestEvent(db.Model):
     """Individual vesting event for a grant."""
     
     __tablename__ = 'vest_events'
+    __table_args__ = (
+        # Schedules are always fetched per grant ordered by date
+        db.Index('ix_vest_events_grant_vestdate', 'grant_id', 'vest_date'),
+        # Year-filtered aggregation (tax year views)
+        db.Index('ix_vest_events_grant_taxyear', 'grant_id', 'tax_year'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     grant_id = db.Column(db.Integer, db.ForeignKey('grants.id'), nullable=False, index=True)
@@ -30,7 +183,13 @@ class VestEvent(db.Model):
     tax_year = db.Column(db.Integer, nullable=True)  # Tax year for historical rate tracking
     notes = db.Column(db.Text, nullable=True)  # User notes about this vest event
     
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    # Denormalized values for past vests - the historical price never changes once
+    # the vest date has passed, so we store it instead of decrypting on every render.
+    # Cleared by invalidate_vest_cache() whenever the user's price history changes.
+    price_at_vest_cached = db.Column(db.Float, nullable=True)
+    value_at_vest_cached = db.Column(db.Float, nullable=True)
+    
+    created_at = db.Column(db.DateTime, default=_utcnow)
     
     def __repr__(self) -> str:
         return f'<VestEvent {self.vest_date} - {self.shares_vested} shares>'
@@ -42,7 +201,7 @@ class VestEvent(db.Model):
         # Handle both datetime and date objects
         if isinstance(vest_date, datetime):
             vest_date = vest_date.date()
-        return vest_date <= date.today()
+        return vest_date <= _today()
     
     @property
     def share_price_at_vest(self) -> float:
@@ -50,21 +209,35 @@ class VestEvent(db.Model):
         Get the stock price at vest date from user's encrypted prices.
         For unvested events (future dates), returns current stock price as estimate.
         For vested events, returns actual historical price at vest date.
+        
+        Memoized per instance: value_at_vest, net_value, tax_withheld and the
+        tax breakdown all read this, and each lookup is a query + decrypt.
         """
-        try:
-            # For unvested shares, use latest available price (current price)
-            if not self.has_vested:
-                price = get_latest_user_price(self.grant.user_id)  # Latest price (today or before)
-                return price if price is not None else 0.0
-            
-            # For vested shares, get actual price at vest date
-            price = get_latest_user_price(self.grant.user_id, as_of_date=self.vest_date)
-            return price if price is not None else 0.0
-        except Exception as e:
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.error(f"Error getting share_price_at_vest: {str(e)}", exc_info=True)
+        if hasattr(self, '_pav_cache'):
+            return self._pav_cache
+        
+        if not self.grant or not self.vest_date:
             return 0.0
+        
+        if self.price_at_vest_cached is not None and self.has_vested:
+            self._pav_cache = self.price_at_vest_cached
+            return self._pav_cache
+        
+        # Unvested: latest available price (today or before) as an estimate.
+        # Vested: actual price at vest date.
+        # get_latest_user_price never raises - a missing price is a normal None.
+        as_of_date = self.vest_date if self.has_vested else None
+        price = get_latest_user_price(self.grant.user_id, as_of_date=as_of_date)
+        self._pav_cache = price if price is not None else 0.0
+        return self._pav_cache
+    
+    def _type_flags(self) -> tuple:
+        """(is_cash, is_iso) for this vest's grant, re-resolved if the grant's share_type changes."""
+        share_type = self.grant.share_type
+        cached = getattr(self, '_type_flags_cache', None)
+        if cached is None or cached[0] != share_type:
+            cached = self._type_flags_cache = (share_type, _SHARE_TYPE_FLAGS.get(share_type, _DEFAULT_TYPE_FLAGS))
+        return cached[1]
     
     @property
     def value_at_vest(self) -> float:
@@ -74,34 +247,69 @@ class VestEvent(db.Model):
         For RSUs/RSAs: value = shares × price_at_vest
         For CASH: value = cash amount (shares_vested represents USD amount)
         """
-        from app.models.grant import ShareType
+        return self._vest_values()[0]
+    
+    def _vest_values(self) -> tuple:
+        """
+        (value_at_vest, net_value, tax_withheld) for this vest.
         
-        # Cash bonuses: shares_vested represents USD amount
-        if self.grant.share_type == ShareType.CASH.value:
-            return self.shares_vested
+        Uses the batch results from preload_values() when present (read-only
+        list views); otherwise computes them from the current fields, so edits
+        to shares, grant or prices are always reflected.
+        """
+        values = getattr(self, '_values_cache', None)
+        if values is None:
+            values = self._compute_values()
+        return values
+    
+    def _compute_values(self) -> tuple:
+        """Evaluate the three dollar values in one pass over the vest's fields."""
+        shares_sold = self.shares_sold or 0.0
+        cash_paid = self.cash_paid or 0.0
+        
+        # Cash bonuses: share counts are USD amounts
+        if self._type_flags()[0]:
+            return (self.shares_vested, self.shares_vested - shares_sold, cash_paid + shares_sold)
         
         price_at_vest = self.share_price_at_vest
+        per_share = self._per_share_value(price_at_vest)
+        
+        if self.value_at_vest_cached is not None and self.has_vested:
+            gross_value = self.value_at_vest_cached
+        else:
+            gross_value = self.shares_vested * per_share
+        net_value = (self.shares_vested - shares_sold) * per_share if price_at_vest else 0.0
         
-        # For ISOs, calculate the spread (price at vest - strike price)
-        if self.grant.share_type in [ShareType.ISO_5Y.value, ShareType.ISO_6Y.value]:
-            spread = price_at_vest - self.grant.share_price_at_grant
-            return self.shares_vested * spread
+        # Shares sold to cover taxes are valued at the vest price
+        tax_withheld = cash_paid + shares_sold * price_at_vest if shares_sold > 0 else cash_paid
+        return (gross_value, net_value, tax_withheld)
+    
+    def _per_share_value(self, price_at_vest: float = None) -> float:
+        """
+        Taxable value of one vested share (non-cash grants only).
+        For ISOs: spread (price_at_vest - strike_price)
+        For RSUs/RSAs/ESPP: full price at vest
         
-        # For RSUs/RSAs/ESPP, use full price at vest
-        return self.shares_vested * price_at_vest
+        Pass price_at_vest when the caller already has it to skip the property.
+        """
+        if price_at_vest is None:
+            price_at_vest = self.share_price_at_vest
+        if self._type_flags()[1]:
+            return price_at_vest - self.grant.share_price_at_grant
+        return price_at_vest
     
     @property
     def shares_withheld_for_taxes(self) -> float:
         """Calculate total shares withheld/sold for taxes."""
         # For cash bonuses, this represents USD withheld
-        # New simplified logic: just return shares_sold directly
         # (shares_sold is what user enters when cash didn't cover all taxes)
-        return self.shares_sold if self.shares_sold else 0.0
+        return self.shares_sold or 0.0
     
     @property
     def shares_received(self) -> float:
         """Calculate actual shares physically received after taxes (or USD for cash bonuses)."""
-        return self.shares_vested - self.shares_withheld_for_taxes
+        # Inlined rather than going through shares_withheld_for_taxes
+        return self.shares_vested - (self.shares_sold or 0.0)
     
     @property
     def needs_tax_info(self) -> bool:
@@ -109,7 +317,7 @@ class VestEvent(db.Model):
         if not self.has_vested:
             return False
         # ESPP/nqESPP don't need tax info - taxes handled at receipt
-        if self.grant.grant_type in ['espp', 'nqespp']:
+        if self.grant.grant_type in ESPP_GRANT_TYPES:
             return False
         # Needs info if vested but no cash paid recorded (for past vests)
         return self.cash_paid == 0 and self.shares_sold == 0
@@ -122,23 +330,7 @@ class VestEvent(db.Model):
         For RSUs/RSAs: net_value = shares_received × price_at_vest
         For CASH: net_value = USD amount received after taxes
         """
-        from app.models.grant import ShareType
-        
-        # Cash bonuses: shares_received represents USD amount
-        if self.grant.share_type == ShareType.CASH.value:
-            return self.shares_received
-        
-        price_at_vest = self.share_price_at_vest
-        if not price_at_vest:
-            return 0.0
-        
-        # For ISOs, calculate based on spread
-        if self.grant.share_type in [ShareType.ISO_5Y.value, ShareType.ISO_6Y.value]:
-            spread = price_at_vest - self.grant.share_price_at_grant
-            return self.shares_received * spread
-        
-        # For RSUs/RSAs/ESPP, use full price
-        return self.shares_received * price_at_vest
+        return self._vest_values()[1]
     
     @property
     def tax_withheld(self) -> float:
@@ -147,36 +339,188 @@ class VestEvent(db.Model):
         For cash bonuses: cash_paid + shares_sold (both in USD)
         For stock grants: cash_paid + (shares_sold × price_at_vest)
         """
-        from app.models.grant import ShareType
+        return self._vest_values()[2]
+    
+    def _get_user(self):
+        """Owner of this vest's grant, loaded once per instance."""
+        if not hasattr(self, '_user_cache'):
+            self._user_cache = self.grant.user
+        return self._user_cache
+    
+    @classmethod
+    def query_with_relations(cls):
+        """
+        Base query for iterating vests: joins Grant and loads grant + owner in the same SELECT.
         
-        total_tax = self.cash_paid
+        Every vest property reads self.grant, so loops over plain
+        VestEvent.query results cost one Grant SELECT per row. Filter on
+        Grant columns directly (the join is already there).
+        """
+        return cls.query.join(Grant).options(
+            contains_eager(cls.grant).joinedload(Grant.user)
+        )
+    
+    @classmethod
+    def preload_prices(cls, events, user_key: bytes) -> None:
+        """
+        Resolve share_price_at_vest for many events with one UserPrice query.
         
-        # Cash bonuses: shares_sold represents USD amount withheld
-        if self.grant.share_type == ShareType.CASH.value:
-            total_tax += self.shares_sold
-        else:
-            # For stock grants: convert shares_sold to USD
-            if self.shares_sold > 0:
-                total_tax += self.shares_sold * self.share_price_at_vest
+        Picks the effective price per event by date and decrypts only the
+        rows actually selected (each once), filling the per-instance cache so
+        list views don't issue a query + decrypt per event. ``user_key`` must
+        belong to the user owning the events' grants.
+        """
+        events = [e for e in events if e.grant and e.vest_date and not hasattr(e, '_pav_cache')]
+        
+        # Persisted prices need no lookup at all
+        pending = []
+        for event in events:
+            if event.price_at_vest_cached is not None and event.has_vested:
+                event._pav_cache = event.price_at_vest_cached
+            else:
+                pending.append(event)
+        if not pending:
+            return
+        
+        today = _today()
+        user_ids = {e.grant.user_id for e in pending}
+        rows = UserPrice.query.filter(
+            UserPrice.user_id.in_(user_ids),
+            UserPrice.valuation_date <= today
+        ).order_by(UserPrice.valuation_date).all()
         
-        return total_tax
+        # {user_id: ([dates], [rows])} sorted by date
+        series = {uid: ([], []) for uid in user_ids}
+        for row in rows:
+            dates, user_rows = series[row.user_id]
+            dates.append(row.valuation_date)
+            user_rows.append(row)
+        
+        decrypted = {}  # row id -> price (undecryptable rows count as no price)
+        for event in pending:
+            dates, user_rows = series[event.grant.user_id]
+            as_of_date = event.vest_date if event.has_vested else today
+            idx = bisect_right(dates, as_of_date) - 1
+            if idx < 0:
+                event._pav_cache = 0.0
+                continue
+            row = user_rows[idx]
+            price = decrypted.get(row.id)
+            if price is None:
+                price = decrypted[row.id] = cls._decrypt_price_row(user_key, row)
+            event._pav_cache = price
+    
+    @classmethod
+    def preload_values(cls, events) -> None:
+        """
+        Compute value_at_vest, net_value and tax_withheld for many events in one pass.
+        
+        Call after preload_prices() on read-only list views; the results are
+        held on each instance, so don't use it on events that are about to be edited.
+        """
+        events = [e for e in events if e.grant and not hasattr(e, '_values_cache')]
+        if not events:
+            return
+        
+        flags = [e._type_flags() for e in events]
+        values = compute_vest_values(
+            [e.shares_vested for e in events],
+            [e.shares_sold or 0.0 for e in events],
+            [e.cash_paid or 0.0 for e in events],
+            [0.0 if cash else e.share_price_at_vest for e, (cash, _) in zip(events, flags)],
+            [e.grant.share_price_at_grant if iso else 0.0 for e, (_, iso) in zip(events, flags)],
+            [cash for cash, _ in flags],
+            [iso for _, iso in flags],
+        )
+        for event, (cash, _), (gross_value, net_value, tax_withheld) in zip(events, flags, values):
+            if not cash and event.value_at_vest_cached is not None and event.has_vested:
+                gross_value = event.value_at_vest_cached
+            event._values_cache = (gross_value, net_value, tax_withheld)
     
-    def get_comprehensive_tax_breakdown(self, _tax_profile=None, _annual_incomes=None, _cached_rates=None, _year_income=None) -> dict:
+    def cache_vest_values(self) -> bool:
+        """
+        Persist price/value at vest for a vested event.
+        Returns True if the cache columns were populated (caller commits).
+        """
+        # Tax fields may have just been edited; drop any preloaded values
+        self.__dict__.pop('_values_cache', None)
+        if not self.has_vested:
+            return False
+        
+        self.price_at_vest_cached = None
+        self.value_at_vest_cached = None
+        price_at_vest = self.share_price_at_vest
+        if not price_at_vest:
+            # No price on file yet - leave uncached so we retry later
+            return False
+        
+        self.price_at_vest_cached = price_at_vest
+        self.value_at_vest_cached = self.value_at_vest
+        return True
+    
+    @classmethod
+    def fill_vest_cache(cls, events) -> int:
+        """
+        Persist price/value at vest for vested events that don't have them yet.
+        
+        The historical price can't change once a vest has passed (edits go
+        through invalidate_vest_cache), so write paths materialize it via
+        refresh_vest_cache(). Call after preload_prices(); returns the number
+        of events filled (caller commits when non-zero).
+        """
+        filled = 0
+        for event in events:
+            if event.grant and event.has_vested and event.price_at_vest_cached is None:
+                if event.cache_vest_values():
+                    filled += 1
+        return filled
+    
+    @classmethod
+    def refresh_vest_cache(cls, user_id: int, user_key: bytes) -> int:
+        """
+        Persist price/value at vest for the user's vested events that lack them.
+        
+        Called from write paths (price and grant edits) so read-only pages never
+        write; returns the number of events filled (caller commits).
+        """
+        events = cls.query.join(Grant).filter(
+            Grant.user_id == user_id,
+            cls.vest_date <= _today(),
+            cls.price_at_vest_cached.is_(None)
+        ).all()
+        cls.preload_prices(events, user_key)
+        return cls.fill_vest_cache(events)
+    
+    @classmethod
+    def invalidate_vest_cache(cls, user_id: int, from_date: date = None) -> None:
+        """
+        Clear cached vest values for a user's vests on or after ``from_date``
+        (all vests if None). Call when a UserPrice is added, edited or deleted.
+        """
+        grant_ids = db.session.query(Grant.id).filter(Grant.user_id == user_id)
+        query = cls.query.filter(cls.grant_id.in_(grant_ids))
+        if from_date is not None:
+            query = query.filter(cls.vest_date >= from_date)
+        query.update({cls.price_at_vest_cached: None, cls.value_at_vest_cached: None},
+                     synchronize_session='fetch')
+    
+    def get_comprehensive_tax_breakdown(self, _tax_profile=None, _annual_incomes=None, _cached_rates=None, _year_income=None,
+                                        price_at_vest: float = None) -> dict:
         """
         Get detailed tax breakdown including FICA, Medicare, Social Security.
         Uses user's simplified tax preferences (federal rate, state rate, FICA toggle).
         
+        Args:
+            price_at_vest: Price the caller has already resolved (skips share_price_at_vest)
+        
         Legacy parameters ignored (kept for backward compatibility):
             _tax_profile, _annual_incomes, _cached_rates, _year_income
         """
         try:
-            from app.models.user import User
-            
             # Get user and their tax preferences
-            user = User.query.get(self.grant.user_id)
+            user = self._get_user()
             if not user:
-                import logging
-                logging.getLogger(__name__).warning(f"No user found for grant.user_id={self.grant.user_id if self.grant else 'NO GRANT'}")
+                logger.warning("No user found for grant.user_id=%s", self.grant.user_id if self.grant else 'NO GRANT')
                 return {
                     'has_breakdown': False,
                     'gross_value': self.value_at_vest,
@@ -185,55 +529,31 @@ class VestEvent(db.Model):
                 }
             
             # Get user's selected tax rates
-            federal_rate = user.get_federal_tax_rate()
-            state_rate = user.get_state_tax_rate()
-            include_fica = user.include_fica if user.include_fica is not None else True
-            ss_wage_base_maxed = user.ss_wage_base_maxed if hasattr(user, 'ss_wage_base_maxed') and user.ss_wage_base_maxed is not None else False
-            
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.info(f"Tax breakdown for vest {self.id}: user={user.id}, federal={federal_rate}, state={state_rate}, fica={include_fica}, ss_maxed={ss_wage_base_maxed}")
+            prefs = _get_user_tax_prefs(user)
+            federal_rate = prefs['federal']
+            state_rate = prefs['state']
+            include_fica = prefs['include_fica']
+            ss_wage_base_maxed = prefs['ss_wage_base_maxed']
             
             # Calculate tax components
-            gross_value = self.value_at_vest
-            federal_tax = gross_value * federal_rate
-            state_tax = gross_value * state_rate
-            
-            # FICA components (if enabled)
-            if include_fica:
-                # Social Security: 6.2% up to wage base (skip if already maxed)
-                if ss_wage_base_maxed:
-                    ss_rate = 0.0
-                    social_security_tax = 0
-                else:
-                    ss_wage_base = 168600
-                    ss_rate = 0.062
-                    # Simplified: assume this vest pushes user over the cap if gross > wage base
-                    if gross_value < ss_wage_base:
-                        social_security_tax = gross_value * ss_rate
-                    else:
-                        social_security_tax = ss_wage_base * ss_rate
-                
-                # Medicare: 1.45% on all income (always applies)
-                medicare_rate = 0.0145
-                medicare_tax = gross_value * medicare_rate
-                
-                # Additional Medicare: 0.9% on income over threshold
-                # $200k single, $250k married - simplified to $200k
-                additional_medicare_threshold = 200000
-                additional_medicare_rate = 0.009
-                if gross_value > additional_medicare_threshold:
-                    additional_medicare_tax = (gross_value - additional_medicare_threshold) * additional_medicare_rate
-                else:
-                    additional_medicare_tax = 0
-                    additional_medicare_rate = 0.0  # Show 0% if not applicable
+            if price_at_vest is None or self._type_flags()[0]:
+                gross_value = self.value_at_vest
             else:
-                ss_rate = 0.0
-                social_security_tax = 0
-                medicare_rate = 0.0
-                medicare_tax = 0
-                additional_medicare_rate = 0.0
-                additional_medicare_tax = 0
+                gross_value = self.shares_vested * self._per_share_value(price_at_vest)
+            
+            # Same inputs as the last call on this instance -> same breakdown.
+            # Callers post-process the result, so always hand out a copy.
+            cache_key = (federal_rate, state_rate, include_fica, ss_wage_base_maxed, gross_value)
+            cached = getattr(self, '_tb_cache', None)
+            if cached is not None and cached[0] == cache_key:
+                return dict(cached[1])
+            
+            logger.info("Tax breakdown for vest %s: user=%s, federal=%s, state=%s, fica=%s, ss_maxed=%s",
+                        self.id, user.id, federal_rate, state_rate, include_fica, ss_wage_base_maxed)
+            
+            (federal_tax, state_tax, social_security_tax, medicare_tax, additional_medicare_tax,
+             ss_rate, medicare_rate, additional_medicare_rate) = tax_breakdown_core(
+                gross_value, federal_rate, state_rate, include_fica, ss_wage_base_maxed)
             
             # Total FICA
             total_fica = social_security_tax + medicare_tax + additional_medicare_tax
@@ -245,7 +565,7 @@ class VestEvent(db.Model):
             # Effective rate (for display)
             effective_rate = total_tax / gross_value if gross_value > 0 else 0.0
             
-            return {
+            breakdown = {
                 'has_breakdown': True,
                 'gross_value': gross_value,
                 'federal_tax': federal_tax,
@@ -266,11 +586,12 @@ class VestEvent(db.Model):
                 'include_fica': include_fica,
                 'tax_year': self.tax_year or self.vest_date.year
             }
+            self._tb_cache = (cache_key, breakdown)
+            return dict(breakdown)
             
         except Exception as e:
             # Log the error but don't crash
-            import logging
-            logging.getLogger(__name__).error(f"Error in get_comprehensive_tax_breakdown: {e}")
+            logger.error("Error in get_comprehensive_tax_breakdown: %s", e)
             # Fallback to basic breakdown
             return {
                 'has_breakdown': False,
@@ -279,6 +600,51 @@ class VestEvent(db.Model):
                 'net_value': self.net_value
             }
     
+    @classmethod
+    def bulk_tax_breakdowns(cls, events) -> list:
+        """
+        Tax breakdowns for many events in one pass.
+        
+        Returns a list aligned with ``events`` holding the same dicts as
+        get_comprehensive_tax_breakdown(). Call preload_prices() first so
+        gross values don't trigger a price lookup per event.
+        """
+        results = [None] * len(events)
+        batch = []  # (index, event, prefs, gross_value)
+        for i, event in enumerate(events):
+            try:
+                user = event._get_user()
+                if not user:
+                    results[i] = event.get_comprehensive_tax_breakdown()
+                    continue
+                batch.append((i, event, _get_user_tax_prefs(user), event.value_at_vest))
+            except Exception as e:
+                logger.error("Error preparing tax breakdown for vest %s: %s", event.id, e)
+                results[i] = event.get_comprehensive_tax_breakdown()
+        
+        if batch:
+            columns = compute_tax_breakdowns(
+                [gross for _, _, _, gross in batch],
+                [prefs['federal'] for _, _, prefs, _ in batch],
+                [prefs['state'] for _, _, prefs, _ in batch],
+                [prefs['include_fica'] for _, _, prefs, _ in batch],
+                [prefs['ss_wage_base_maxed'] for _, _, prefs, _ in batch],
+            )
+            for row, (i, event, prefs, gross_value) in enumerate(batch):
+                breakdown = {key: values[row] for key, values in columns.items()}
+                breakdown.update({
+                    'has_breakdown': True,
+                    'gross_value': gross_value,
+                    'net_amount': breakdown['net_value'],
+                    'federal_rate': prefs['federal'],
+                    'state_rate': prefs['state'],
+                    'include_fica': prefs['include_fica'],
+                    'tax_year': event.tax_year or event.vest_date.year
+                })
+                results[i] = breakdown
+        
+        return results
+    
     def estimate_tax_withholding(self, current_stock_price: float = None, 
                                  federal_rate: float = None, 
                                  state_rate: float = None, 
@@ -299,9 +665,6 @@ class VestEvent(db.Model):
             fica_rate: DEPRECATED - uses user profile
             _tax_profile: DEPRECATED - no longer needed
         """
-        from app.models.grant import ShareType, GrantType
-        from app.models.user import User
-        
         # If already vested, return actual taxes paid
         if self.has_vested:
             return {
@@ -310,37 +673,22 @@ class VestEvent(db.Model):
                 'tax_rate': 0.0  # Not calculated for actual
             }
         
-        # For future vests, estimate based on current price
-        if current_stock_price is None:
-            from app.utils.price_utils import get_latest_user_price
+        is_cash, is_iso = self._type_flags()
+        
+        # For future vests, estimate based on current price (cash bonuses don't need one)
+        if current_stock_price is None and not is_cash:
             current_stock_price = get_latest_user_price(self.grant.user_id) or 0.0
         
         # Get user's tax preferences (simple approach)
-        user = User.query.get(self.grant.user_id)
+        user = self._get_user()
         if not user:
             # Fallback to defaults
             tax_rate = 0.22 + 0.093 + 0.0765  # Default: 22% federal + 9.3% state + 7.65% FICA
         else:
-            rates = user.get_tax_rates()
-            tax_rate = rates['total']
-        
-        # Calculate vest value based on grant type
-        if self.grant.share_type == ShareType.CASH.value:
-            vest_value = self.shares_vested
-        elif self.grant.share_type in [ShareType.ISO_5Y.value, ShareType.ISO_6Y.value]:
-            # ISOs: tax on spread (current_price - strike_price)
-            spread = current_stock_price - self.grant.share_price_at_grant
-            vest_value = self.shares_vested * spread if spread > 0 else 0.0
-        elif self.grant.grant_type == GrantType.ESPP.value and self.grant.espp_discount:
-            # ESPP: tax on discount portion (ordinary income)
-            discount_gain = self.shares_vested * current_stock_price * self.grant.espp_discount
-            vest_value = discount_gain
-        else:
-            # RSUs/RSAs: full value is taxable as ordinary income
-            vest_value = self.shares_vested * current_stock_price
+            tax_rate = _get_user_tax_prefs(user)['total']
         
         # Calculate estimated tax
-        estimated_tax = vest_value * tax_rate
+        estimated_tax = self._estimated_vest_value(current_stock_price) * tax_rate
         
         return {
             'tax_amount': estimated_tax,
@@ -348,11 +696,63 @@ class VestEvent(db.Model):
             'tax_rate': tax_rate
         }
     
+    def _estimated_vest_value(self, current_stock_price: float) -> float:
+        """Taxable ordinary income of a future vest at the given stock price."""
+        is_cash, is_iso = self._type_flags()
+        if is_cash:
+            return self.shares_vested
+        grant = self.grant
+        if is_iso:
+            # ISOs: tax on spread (current_price - strike_price)
+            spread = current_stock_price - grant.share_price_at_grant
+            return self.shares_vested * spread if spread > 0 else 0.0
+        if grant.grant_type == GrantType.ESPP.value and grant.espp_discount:
+            # ESPP: tax on discount portion (ordinary income)
+            return self.shares_vested * current_stock_price * grant.espp_discount
+        # RSUs/RSAs: full value is taxable as ordinary income
+        return self.shares_vested * current_stock_price
+    
+    @classmethod
+    def estimate_tax_withholding_batch(cls, events, current_stock_price: float = None) -> list:
+        """
+        estimate_tax_withholding() for many events in one pass.
+        
+        The latest price and tax rate are looked up once per user rather than
+        once per event. Returns one result dict per event, in order.
+        """
+        latest_prices = {}
+        results = []
+        for event in events:
+            if event.has_vested:
+                results.append(event.estimate_tax_withholding())
+                continue
+            
+            user_id = event.grant.user_id
+            price = current_stock_price
+            if price is None and not event._type_flags()[0]:
+                if user_id not in latest_prices:
+                    latest_prices[user_id] = get_latest_user_price(user_id) or 0.0
+                price = latest_prices[user_id]
+            
+            user = event._get_user()
+            if not user:
+                tax_rate = 0.22 + 0.093 + 0.0765  # Default: 22% federal + 9.3% state + 7.65% FICA
+            else:
+                tax_rate = _get_user_tax_prefs(user)['total']
+            
+            results.append({
+                'tax_amount': event._estimated_vest_value(price) * tax_rate,
+                'is_estimated': True,
+                'tax_rate': tax_rate
+            })
+        return results
+    
     def get_estimated_sale_tax(self, current_stock_price: float = None, 
                                total_sold: float = 0, 
                                total_exercised: float = 0,
                                _tax_profile=None,
-                               _annual_incomes=None) -> dict:
+                               _annual_incomes=None,
+                               today: date = None) -> SaleTaxEstimate:
         """
         Calculate estimated capital gains tax on remaining shares if sold today.
         
@@ -365,9 +765,10 @@ class VestEvent(db.Model):
             total_exercised: Total shares already exercised (for ISOs)
             _tax_profile: INTERNAL - cached tax profile to avoid N+1 queries
             _annual_incomes: INTERNAL - dict of {year: income} to avoid N+1 queries
+            today: Date to measure the holding period to (defaults to today, read once per request)
             
         Returns:
-            dict with:
+            SaleTaxEstimate with:
                 - shares_held: Remaining shares
                 - cost_basis_per_share: Cost basis per share
                 - cost_basis: Total cost basis
@@ -384,47 +785,50 @@ class VestEvent(db.Model):
                 - state_rate: State rate used
                 - method: 'simplified' (always)
         """
-        from app.models.grant import ShareType
-        from app.models.user import User
-        from datetime import date
-        
-        # Get current stock price if not provided
-        if current_stock_price is None:
-            from app.utils.price_utils import get_latest_user_price
-            current_stock_price = get_latest_user_price(self.grant.user_id) or 0.0
+        is_cash, is_iso = self._type_flags()
         
         # Calculate remaining shares
         shares_held = self.shares_received - total_sold - total_exercised
         
         # For cash grants, no capital gains (cash doesn't appreciate)
-        if self.grant.share_type == ShareType.CASH.value:
-            return {
-                'shares_held': shares_held,
-                'cost_basis_per_share': 1.0,
-                'cost_basis': shares_held,
-                'current_value': shares_held,
-                'unrealized_gain': 0.0,
-                'days_held': 0,
-                'is_long_term': False,
-                'holding_period': '—',
-                'estimated_tax': 0.0,
-                'federal_tax': 0.0,
-                'niit_tax': 0.0,
-                'state_tax': 0.0,
-                'federal_rate': 0.0,
-                'state_rate': 0.0,
-                'method': 'n/a'
-            }
+        if is_cash:
+            return SaleTaxEstimate(
+                shares_held=shares_held,
+                cost_basis_per_share=1.0,
+                cost_basis=shares_held,
+                current_value=shares_held,
+                unrealized_gain=0.0,
+                days_held=0,
+                is_long_term=False,
+                holding_period='—',
+                estimated_tax=0.0,
+                federal_tax=0.0,
+                niit_tax=0.0,
+                state_tax=0.0,
+                federal_rate=0.0,
+                state_rate=0.0,
+                method='n/a'
+            )
+        
+        grant = self.grant
+        has_vested = self.has_vested
+        
+        # Get current stock price if not provided (nothing left to value if all shares are gone)
+        if current_stock_price is None:
+            if shares_held > 0:
+                current_stock_price = get_latest_user_price(grant.user_id) or 0.0
+            else:
+                current_stock_price = 0.0
         
         # Determine cost basis based on grant type
         # ISOs: cost basis is strike price (share_price_at_grant)
         # RSUs/RSAs/ESPP: cost basis is FMV at vest (share_price_at_vest)
-        if self.grant.share_type in [ShareType.ISO_5Y.value, ShareType.ISO_6Y.value]:
-            cost_basis_per_share = self.grant.share_price_at_grant
+        if is_iso:
+            cost_basis_per_share = grant.share_price_at_grant
         else:
             # For unvested shares, share_price_at_vest is 0 (unknown future price)
             # Use current price as estimated cost basis for projection purposes
-            cost_basis_per_share = self.share_price_at_vest if self.has_vested else current_stock_price
+            cost_basis_per_share = self.share_price_at_vest if has_vested else current_stock_price
         
         # Calculate values
         cost_basis = shares_held * cost_basis_per_share
@@ -432,95 +836,102 @@ class VestEvent(db.Model):
         unrealized_gain = current_value - cost_basis
         
         # Calculate holding period
-        today = date.today()
-        days_held = (today - self.vest_date).days if self.has_vested else 0
+        if today is None:
+            today = _today()
+        days_held = today.toordinal() - self.vest_date.toordinal() if has_vested else 0
         is_long_term = days_held >= 365
         
-        if self.has_vested:
-            if days_held >= 365:
-                years = days_held // 365
-                holding_period = f"{years}y {days_held % 365}d"
-            else:
-                holding_period = f"{days_held}d"
-        else:
-            holding_period = "—"
+        holding_period = _format_holding_period(days_held) if has_vested else "—"
         
         # Calculate estimated tax using simplified rates
-        # Get user and their tax preferences
-        from app.models.user import User
-        user = User.query.get(self.grant.user_id)
+        # Get user and their tax preferences (only needed when there's a gain to tax)
+        user = self._get_user() if unrealized_gain > 0 else None
         
-        if not user or unrealized_gain <= 0:
+        if not user:
             # No user or no gain = no tax
-            return {
-                'shares_held': shares_held,
-                'cost_basis_per_share': cost_basis_per_share,
-                'cost_basis': cost_basis,
-                'current_value': current_value,
-                'unrealized_gain': unrealized_gain,
-                'days_held': days_held,
-                'is_long_term': is_long_term,
-                'holding_period': holding_period,
-                'estimated_tax': 0.0,
-                'federal_tax': 0.0,
-                'niit_tax': 0.0,
-                'state_tax': 0.0,
-                'federal_rate': 0.0,
-                'state_rate': 0.0,
-                'method': 'none'
-            }
-        
-        # Use simplified capital gains rates based on holding period
-        if is_long_term:
-            # Long-term capital gains: typically 0%, 15%, or 20%
-            # Use 15% as reasonable default for most users
-            federal_rate = 0.15
-        else:
-            # Short-term capital gains: taxed as ordinary income
-            # Use user's federal tax rate
-            federal_rate = user.get_federal_tax_rate()
-        
-        state_rate = user.get_state_tax_rate()
-        
-        # Calculate taxes
-        federal_tax = unrealized_gain * federal_rate
-        state_tax = unrealized_gain * state_rate
-        
-        # NIIT (Net Investment Income Tax): 3.8% on investment income for high earners
-        # Applies to single filers with MAGI > $200k, married > $250k
-        # Simplified: apply if federal rate is high (proxy for high earner)
-        if user.get_federal_tax_rate() >= 0.32:  # Likely high earner
-            niit_tax = unrealized_gain * 0.038
-        else:
-            niit_tax = 0.0
+            return SaleTaxEstimate(
+                shares_held=shares_held,
+                cost_basis_per_share=cost_basis_per_share,
+                cost_basis=cost_basis,
+                current_value=current_value,
+                unrealized_gain=unrealized_gain,
+                days_held=days_held,
+                is_long_term=is_long_term,
+                holding_period=holding_period,
+                estimated_tax=0.0,
+                federal_tax=0.0,
+                niit_tax=0.0,
+                state_tax=0.0,
+                federal_rate=0.0,
+                state_rate=0.0,
+                method='none'
+            )
         
+        prefs = _get_user_tax_prefs(user)
+        state_rate = prefs['state']
+        federal_rate, federal_tax, state_tax, niit_tax = sale_tax_core(
+            unrealized_gain, is_long_term, prefs['federal'], state_rate)
         estimated_tax = federal_tax + state_tax + niit_tax
         
-        return {
-            'shares_held': shares_held,
-            'cost_basis_per_share': cost_basis_per_share,
-            'cost_basis': cost_basis,
-            'current_value': current_value,
-            'unrealized_gain': unrealized_gain,
-            'days_held': days_held,
-            'is_long_term': is_long_term,
-            'holding_period': holding_period,
-            'estimated_tax': estimated_tax,
-            'federal_tax': federal_tax,
-            'niit_tax': niit_tax,
-            'state_tax': state_tax,
-            'federal_rate': federal_rate,
-            'state_rate': state_rate,
-            'method': 'simplified'
-        }
+        return SaleTaxEstimate(
+            shares_held=shares_held,
+            cost_basis_per_share=cost_basis_per_share,
+            cost_basis=cost_basis,
+            current_value=current_value,
+            unrealized_gain=unrealized_gain,
+            days_held=days_held,
+            is_long_term=is_long_term,
+            holding_period=holding_period,
+            estimated_tax=estimated_tax,
+            federal_tax=federal_tax,
+            niit_tax=niit_tax,
+            state_tax=state_tax,
+            federal_rate=federal_rate,
+            state_rate=state_rate,
+            method='simplified'
+        )
+    
+    def _fallback_vest_data(self, error: str, has_vested: bool = False,
+                            is_iso: bool = False, is_cash: bool = False) -> VestData:
+        """Minimal VestData for when get_complete_data can't compute values."""
+        grant = self.grant
+        shares_received = self.shares_received or 0.0
+        return _EMPTY_VEST_DATA._replace(
+            vest_id=self.id,
+            vest_date=self.vest_date,
+            has_vested=has_vested,
+            is_iso=is_iso,
+            is_cash=is_cash,
+            grant_type=grant.grant_type if grant is not None else None,
+            share_type=grant.share_type if grant is not None else None,
+            strike_price=grant.share_price_at_grant if grant is not None else None,
+            shares_vested=self.shares_vested or 0.0,
+            shares_received=shares_received,
+            shares_remaining=shares_received,
+            cash_paid=self.cash_paid or 0.0,
+            cash_covered_all=self.cash_covered_all or False,
+            notes=self.notes or '',
+            needs_tax_info=self.needs_tax_info if grant is not None else False,
+            error=error
+        )
+    
+    @staticmethod
+    def _decrypt_price_row(user_key: bytes, price_row) -> float:
+        """Decrypt a UserPrice row to a float; 0.0 if missing or undecryptable."""
+        if price_row is None:
+            return 0.0
+        try:
+            return float(decrypt_for_user_cached(user_key, price_row.encrypted_price))
+        except Exception:
+            return 0.0
     
     def get_complete_data(self, user_key: bytes, current_price: float = None, 
                          tax_profile=None, annual_incomes=None, 
-                         sales_data=None, exercises_data=None) -> dict:
+                         sales_data=None, exercises_data=None) -> VestData:
         """
         **SINGLE SOURCE OF TRUTH** for all vest event data.
         
-        Returns comprehensive dict with ALL vest information:
+        Returns a VestData tuple with ALL vest information:
         - Basic info (dates, shares, vested status)
         - Prices (at vest, current, strike if ISO)
         - Values (gross, net, cost basis)
@@ -537,10 +948,35 @@ class VestEvent(db.Model):
             exercises_data: List of ISOExercise objects for this vest (optional)
             
         Returns:
-            Comprehensive dict with all vest data
+            VestData with all vest data
+        
+        Load the event through query_with_relations() (or with the grant
+        otherwise eager-loaded) when calling this for many events.
         """
-        import logging
-        logger = logging.getLogger(__name__)
+        
+        # Validate inputs
+        if not user_key:
+            logger.warning("get_complete_data called with empty user_key")
+            user_key = b''
+        
+        grant = self.grant
+        if grant is None:
+            logger.error("get_complete_data: VestEvent %s has no associated grant", self.id)
+            return self._fallback_vest_data(f"VestEvent {self.id} has no associated grant")
+        
+        # Same inputs as the last successful call on this instance -> same result
+        sold_lots = tuple(s.shares_sold for s in sales_data or ())
+        exercised_lots = tuple(e.shares_exercised for e in exercises_data or ())
+        cache_key = (
+            user_key, current_price, self.vest_date, self.shares_vested, self.shares_sold,
+            self.cash_paid, self.cash_covered_all, self.tax_year, self.notes,
+            sold_lots, exercised_lots,
+            grant.id, grant.user_id, grant.share_type, grant.grant_type,
+            grant.share_price_at_grant, grant.espp_discount,
+        )
+        cached = getattr(self, '_complete_data_cache', None)
+        if cached is not None and cached[0] == cache_key:
+            return cached[1]
         
         # Initialize variables that might be used in except block
         has_vested = False
@@ -548,212 +984,189 @@ class VestEvent(db.Model):
         is_cash = False
         
         try:
-            from app.models.grant import ShareType
-            from app.models.user_price import UserPrice
-            from app.utils.encryption import decrypt_for_user
-            from datetime import date
-            
-            # Validate inputs
-            if not user_key:
-                logger.warning("get_complete_data called with empty user_key")
-                user_key = b''
-            
-            if not self.grant:
-                raise ValueError(f"VestEvent {self.id} has no associated grant")
-            
-            today = date.today()
+            today = _today()
             
             # === BASIC INFO ===
             has_vested = self.vest_date <= today if self.vest_date else False
-            is_iso = self.grant.share_type in [ShareType.ISO_5Y.value, ShareType.ISO_6Y.value] if self.grant.share_type else False
-            is_cash = self.grant.share_type == ShareType.CASH.value if self.grant.share_type else False
+            is_cash, is_iso = self._type_flags()
             # === PRICES ===
-            # Get price at vest date (historical for vested, current for unvested)
-            if has_vested:
-                # Get actual price at vest date
-                price_query = UserPrice.query.filter_by(user_id=self.grant.user_id).filter(
-                    UserPrice.valuation_date <= self.vest_date
-                ).order_by(UserPrice.valuation_date.desc()).first()
-            else:
-                # Get latest price for unvested
-                price_query = UserPrice.query.filter_by(user_id=self.grant.user_id).filter(
+            # The latest price doubles as the price at vest for unvested events, and
+            # for vested ones when no newer price has been entered since the vest date
+            latest_row = None
+            if current_price is None or not has_vested:
+                latest_row = UserPrice.query.filter_by(user_id=grant.user_id).filter(
                     UserPrice.valuation_date <= today
                 ).order_by(UserPrice.valuation_date.desc()).first()
             
-            price_at_vest = 0.0
-            if price_query:
-                try:
-                    price_str = decrypt_for_user(user_key, price_query.encrypted_price)
-                    price_at_vest = float(price_str)
-                except Exception:
-                    price_at_vest = 0.0
+            if has_vested and self.price_at_vest_cached is not None:
+                # Persisted by the write paths (cleared when prices change) - no lookup needed
+                vest_row = None
+                price_at_vest = self.price_at_vest_cached
+            else:
+                if not has_vested:
+                    vest_row = latest_row
+                elif latest_row is not None and latest_row.valuation_date <= self.vest_date:
+                    vest_row = latest_row
+                else:
+                    # Get actual price at vest date
+                    vest_row = UserPrice.query.filter_by(user_id=grant.user_id).filter(
+                        UserPrice.valuation_date <= self.vest_date
+                    ).order_by(UserPrice.valuation_date.desc()).first()
+                price_at_vest = self._decrypt_price_row(user_key, vest_row)
             
             # Get current price
             if current_price is None:
-                current_price_query = UserPrice.query.filter_by(user_id=self.grant.user_id).filter(
-                    UserPrice.valuation_date <= today
-                ).order_by(UserPrice.valuation_date.desc()).first()
-                
-                if current_price_query:
-                    try:
-                        price_str = decrypt_for_user(user_key, current_price_query.encrypted_price)
-                        current_price = float(price_str)
-                    except Exception:
-                        current_price = 0.0
+                if vest_row is not None and latest_row is vest_row:
+                    current_price = price_at_vest
                 else:
-                    current_price = 0.0
-            
-            strike_price = self.grant.share_price_at_grant if is_iso else None
+                    current_price = self._decrypt_price_row(user_key, latest_row)
             
             # === VALUES AT VEST ===
             shares_vested = self.shares_vested or 0.0
-            shares_sold_for_tax = self.shares_sold or 0.0
+            shares_withheld = self.shares_sold or 0.0
             cash_paid = self.cash_paid or 0.0
-            
-            if is_cash:
-                gross_value = shares_vested  # USD amount
-                shares_withheld = shares_sold_for_tax  # USD withheld
-                tax_withheld_value = cash_paid + shares_withheld
-            elif is_iso:
-                # For ISOs, ensure strike_price exists
-                if strike_price is None:
-                    strike_price = 0.0
-                spread = price_at_vest - strike_price
-                gross_value = shares_vested * spread
-                shares_withheld = shares_sold_for_tax
-                tax_withheld_value = cash_paid + (shares_withheld * price_at_vest)
-            else:  # RSU/RSA/ESPP
-                gross_value = shares_vested * price_at_vest
-                shares_withheld = shares_sold_for_tax
-                tax_withheld_value = cash_paid + (shares_withheld * price_at_vest)
-            
             shares_received = shares_vested - shares_withheld
             
-            if is_cash:
-                net_value = shares_received  # USD after tax
-            elif is_iso:
-                net_value = shares_received * spread
-            else:
-                net_value = shares_received * price_at_vest
-            
             # === SHARE DISPOSITION ===
-            total_sold = sum(s.shares_sold for s in sales_data) if sales_data else 0
-            total_exercised = sum(e.shares_exercised for e in exercises_data) if exercises_data else 0
+            total_sold = sum(sold_lots)
+            total_exercised = sum(exercised_lots)
             remaining_shares = shares_received - total_sold - total_exercised
             
-            # === COST BASIS ===
             if is_cash:
-                cost_basis_per_share = 1.0
-            elif is_iso:
-                cost_basis_per_share = strike_price if strike_price is not None else 0.0
-            else:
+                # Cash bonuses: amounts are USD - no strike, spread, cost basis or sale tax
+                vest_data = VestData(
+                    vest_id=self.id,
+                    vest_date=self.vest_date,
+                    has_vested=has_vested,
+                    is_iso=False,
+                    is_cash=True,
+                    grant_type=grant.grant_type,
+                    share_type=grant.share_type,
+                    shares_vested=self.shares_vested,
+                    shares_withheld_for_taxes=shares_withheld,  # USD withheld
+                    shares_received=shares_received,  # USD after tax
+                    shares_sold=total_sold,
+                    shares_exercised=total_exercised,
+                    shares_remaining=remaining_shares,
+                    price_at_vest=price_at_vest,
+                    current_price=current_price,
+                    strike_price=None,
+                    cost_basis_per_share=1.0,
+                    gross_value=shares_vested,  # USD amount
+                    tax_withheld_value=cash_paid + shares_withheld,
+                    net_value=shares_received,
+                    current_market_value=remaining_shares,
+                    total_cost_basis=remaining_shares,
+                    unrealized_gain=0,
+                    cash_paid=self.cash_paid,
+                    cash_covered_all=self.cash_covered_all,
+                    tax_breakdown=None,
+                    sale_tax_projection=None,
+                    notes=self.notes,
+                    needs_tax_info=self.needs_tax_info,
+                )
+                self._complete_data_cache = (cache_key, vest_data)
+                return vest_data
+            
+            # === PER-SHARE VALUE AND COST BASIS (one branch per share type) ===
+            if is_iso:
+                # For ISOs, ensure strike_price exists; value is the spread, basis the strike
+                strike_price = grant.share_price_at_grant
+                if strike_price is None:
+                    strike_price = 0.0
+                per_share_value = price_at_vest - strike_price
+                cost_basis_per_share = strike_price
+            else:  # RSU/RSA/ESPP
+                strike_price = None
+                per_share_value = price_at_vest
                 # For unvested, use current price as estimate; for vested, use actual
                 cost_basis_per_share = price_at_vest if has_vested else current_price
             
+            gross_value = shares_vested * per_share_value
+            net_value = shares_received * per_share_value
+            tax_withheld_value = cash_paid + (shares_withheld * price_at_vest)
+            
+            # === CURRENT POSITION ===
+            total_cost_basis = remaining_shares * cost_basis_per_share
+            current_market_value = remaining_shares * current_price
+            unrealized_gain = current_market_value - total_cost_basis
+            
             # === TAX BREAKDOWN (uses user's tax preferences directly) ===
             tax_breakdown = None
-            if not is_cash:
-                try:
-                    tax_breakdown = self.get_comprehensive_tax_breakdown(
-                        _tax_profile=tax_profile,
-                        _annual_incomes=annual_incomes
-                    )
-                except Exception as e:
-                    import logging
-                    logging.getLogger(__name__).error(f"Error getting tax breakdown: {e}")
+            try:
+                tax_breakdown = self.get_comprehensive_tax_breakdown(
+                    _tax_profile=tax_profile,
+                    _annual_incomes=annual_incomes,
+                    price_at_vest=price_at_vest
+                )
+            except Exception as e:
+                logger.error("Error getting tax breakdown: %s", e)
             
             # === SALE TAX PROJECTION ===
             sale_tax_projection = None
-            if remaining_shares > 0 and not is_cash:
+            if remaining_shares > 0:
                 try:
                     sale_tax_projection = self.get_estimated_sale_tax(
                         current_stock_price=current_price,
                         total_sold=total_sold,
                         total_exercised=total_exercised,
                         _tax_profile=tax_profile,
-                        _annual_incomes=annual_incomes
+                        _annual_incomes=annual_incomes,
+                        today=today
                     )
                 except Exception as e:
-                    import logging
-                    logging.getLogger(__name__).error(f"Error getting sale tax projection: {e}")
+                    logger.error("Error getting sale tax projection: %s", e)
             
             # === BUILD COMPREHENSIVE RESPONSE ===
-            return {
+            vest_data = VestData(
                 # Basic info
-                'vest_id': self.id,
-                'vest_date': self.vest_date,
-                'has_vested': has_vested,
-                'is_iso': is_iso,
-                'is_cash': is_cash,
-                'grant_type': self.grant.grant_type,
-                'share_type': self.grant.share_type,
+                vest_id=self.id,
+                vest_date=self.vest_date,
+                has_vested=has_vested,
+                is_iso=is_iso,
+                is_cash=is_cash,
+                grant_type=grant.grant_type,
+                share_type=grant.share_type,
                 
                 # Shares
-                'shares_vested': self.shares_vested,
-                'shares_withheld_for_taxes': shares_withheld,
-                'shares_received': shares_received,
-                'shares_sold': total_sold,
-                'shares_exercised': total_exercised,
-                'shares_remaining': remaining_shares,
+                shares_vested=self.shares_vested,
+                shares_withheld_for_taxes=shares_withheld,
+                shares_received=shares_received,
+                shares_sold=total_sold,
+                shares_exercised=total_exercised,
+                shares_remaining=remaining_shares,
                 
                 # Prices
-                'price_at_vest': price_at_vest,
-                'current_price': current_price,
-                'strike_price': strike_price,  # None for non-ISOs
-                'cost_basis_per_share': cost_basis_per_share,
+                price_at_vest=price_at_vest,
+                current_price=current_price,
+                strike_price=strike_price,  # None for non-ISOs
+                cost_basis_per_share=cost_basis_per_share,
                 
                 # Values
-                'gross_value': gross_value,
-                'tax_withheld_value': tax_withheld_value,
-                'net_value': net_value,
-                'current_market_value': remaining_shares * current_price if not is_cash else remaining_shares,
-                'total_cost_basis': remaining_shares * cost_basis_per_share,
-                'unrealized_gain': (remaining_shares * current_price) - (remaining_shares * cost_basis_per_share) if not is_cash else 0,
+                gross_value=gross_value,
+                tax_withheld_value=tax_withheld_value,
+                net_value=net_value,
+                current_market_value=current_market_value,
+                total_cost_basis=total_cost_basis,
+                unrealized_gain=unrealized_gain,
                 
                 # Tax payment method
-                'cash_paid': self.cash_paid,
-                'cash_covered_all': self.cash_covered_all,
+                cash_paid=self.cash_paid,
+                cash_covered_all=self.cash_covered_all,
                 
                 # Tax calculations
-                'tax_breakdown': tax_breakdown,  # Vest tax breakdown
-                'sale_tax_projection': sale_tax_projection,  # Capital gains projection
+                tax_breakdown=tax_breakdown,  # Vest tax breakdown
+                sale_tax_projection=sale_tax_projection,  # Capital gains projection
                 
                 # Metadata
-                'notes': self.notes,
-                'needs_tax_info': self.needs_tax_info,
-            }
+                notes=self.notes,
+                needs_tax_info=self.needs_tax_info,
+            )
+            self._complete_data_cache = (cache_key, vest_data)
+            return vest_data
         except Exception as e:
-            logger.error(f"Error calculating vest data in get_complete_data: {e}", exc_info=True)
+            # Full traceback only when debugging; the message alone is enough in production
+            logger.error("Error calculating vest data in get_complete_data: %s", e,
+                         exc_info=logger.isEnabledFor(logging.DEBUG))
             # Return minimal data on error (variables already initialized at method start)
-            return {
-                'vest_id': self.id,
-                'vest_date': self.vest_date if hasattr(self, 'vest_date') else None,
-                'has_vested': has_vested,
-                'is_iso': is_iso,
-                'is_cash': is_cash,
-                'grant_type': self.grant.grant_type if self.grant else None,
-                'share_type': self.grant.share_type if self.grant else None,
-                'shares_vested': self.shares_vested or 0.0,
-                'shares_withheld_for_taxes': 0.0,
-                'price_at_vest': 0.0,
-                'gross_value': 0.0,
-                'tax_withheld_value': 0.0,
-                'shares_received': self.shares_received or 0.0,
-                'net_value': 0.0,
-                'current_price': 0.0,
-                'current_market_value': 0.0,
-                'total_cost_basis': 0.0,
-                'unrealized_gain': 0.0,
-                'strike_price': self.grant.share_price_at_grant if self.grant and hasattr(self.grant, 'share_price_at_grant') else None,
-                'cost_basis_per_share': 0.0,
-                'shares_sold': 0.0,
-                'shares_exercised': 0.0,
-                'shares_remaining': self.shares_received or 0.0,
-                'tax_breakdown': None,
-                'sale_tax_projection': None,
-                'cash_paid': self.cash_paid or 0.0,
-                'cash_covered_all': self.cash_covered_all or False,
-                'notes': self.notes if hasattr(self, 'notes') else '',
-                'needs_tax_info': self.needs_tax_info if hasattr(self, 'needs_tax_info') else False,
-                'error': str(e)
-            }
\ No newline at end of file
+            return self._fallback_vest_data(str(e), has_vested, is_iso, is_cash)
@@ -2,7 +2,7 @@
 Admin routes - manage stock prices, view users.
 """
 
-from flask import Blueprint, render_template, redirect, url_for, flash, request, jsonify
+from flask import Blueprint, render_template, redirect, url_for, flash, request, jsonify, current_app
 from flask_login import login_required, current_user
 from functools import wraps
 from app import db
@@ -89,18 +89,37 @@ def delete_stock_price(price_id):
     return redirect(url_for('admin.stock_prices'))
 
 
+# Last chart payload and the table version it was built from, stored per app as
+# one immutable (version, data) tuple so threads never see a mismatched pair.
+# Prices are only added or deleted, so (count, max id, max created_at) changes
+# whenever the rows do - checked per request, so every worker process stays consistent.
+_CHART_DATA_CACHE_KEY = 'admin_chart_data'
+
+
 @admin_bp.route('/stock-prices/chart-data')
 @admin_required
 def stock_price_chart_data():
     """Get stock price data for chart."""
-    prices = StockPrice.query.order_by(StockPrice.valuation_date).all()
+    version = tuple(db.session.query(
+        db.func.count(StockPrice.id),
+        db.func.max(StockPrice.id),
+        db.func.max(StockPrice.created_at)
+    ).one())
     
-    data = {
-        'dates': [p.valuation_date.isoformat() for p in prices],
-        'prices': [p.price_per_share for p in prices]
-    }
+    cached = current_app.extensions.get(_CHART_DATA_CACHE_KEY)
+    if cached is None or cached[0] != version:
+        prices = db.session.query(
+            StockPrice.valuation_date, StockPrice.price_per_share
+        ).order_by(StockPrice.valuation_date).all()
+        
+        data = {
+            'dates': tuple(valuation_date.isoformat() for valuation_date, _ in prices),
+            'prices': tuple(price for _, price in prices)
+        }
+        cached = (version, data)
+        current_app.extensions[_CHART_DATA_CACHE_KEY] = cached
     
-    return jsonify(data)
+    return jsonify(cached[1])
 
 
 @admin_bp.route('/users')
@@ -187,59 +206,59 @@ def run_migration():
         # Use the same brackets for all years (tax brackets change slowly)
         years_to_populate = [2023, 2024, 2025]
         
-        for year in years_to_populate:
-            existing = TaxBracket.query.filter_by(tax_year=year).count()
-            if existing > 0:
-                continue  # Skip if already populated
-            
-            # Federal ordinary income (Single)
-            federal_single = [
-                {'min': 0, 'max': 11600, 'rate': 0.10},
-                {'min': 11600, 'max': 47150, 'rate': 0.12},
-                {'min': 47150, 'max': 100525, 'rate': 0.22},
-                {'min': 100525, 'max': 191950, 'rate': 0.24},
-                {'min': 191950, 'max': 243725, 'rate': 0.32},
-                {'min': 243725, 'max': 609350, 'rate': 0.35},
-                {'min': 609350, 'max': None, 'rate': 0.37},
-            ]
-            
-            for b in federal_single:
-                db.session.add(TaxBracket(
-                    jurisdiction='federal', tax_year=year, filing_status='single',
-                    tax_type='ordinary', income_min=b['min'], income_max=b['max'], rate=b['rate']
-                ))
-            
-            # Federal LTCG (Single)
-            ltcg_single = [
-                {'min': 0, 'max': 47025, 'rate': 0.00},
-                {'min': 47025, 'max': 518900, 'rate': 0.15},
-                {'min': 518900, 'max': None, 'rate': 0.20},
-            ]
-            
-            for b in ltcg_single:
-                db.session.add(TaxBracket(
-                    jurisdiction='federal', tax_year=year, filing_status='single',
-                    tax_type='capital_gains_long', income_min=b['min'], income_max=b['max'], rate=b['rate']
-                ))
-            
-            # California (Single)
-            ca_single = [
-                {'min': 0, 'max': 10412, 'rate': 0.01},
-                {'min': 10412, 'max': 24684, 'rate': 0.02},
-                {'min': 24684, 'max': 38959, 'rate': 0.04},
-                {'min': 38959, 'max': 54081, 'rate': 0.06},
-                {'min': 54081, 'max': 68350, 'rate': 0.08},
-                {'min': 68350, 'max': 349137, 'rate': 0.093},
-                {'min': 349137, 'max': 418961, 'rate': 0.103},
-                {'min': 418961, 'max': 698271, 'rate': 0.113},
-                {'min': 698271, 'max': None, 'rate': 0.123},
-            ]
-            
-            for b in ca_single:
-                db.session.add(TaxBracket(
-                    jurisdiction='CA', tax_year=year, filing_status='single',
-                    tax_type='ordinary', income_min=b['min'], income_max=b['max'], rate=b['rate']
-                ))
+        # Federal ordinary income (Single)
+        federal_single = [
+            {'min': 0, 'max': 11600, 'rate': 0.10},
+            {'min': 11600, 'max': 47150, 'rate': 0.12},
+            {'min': 47150, 'max': 100525, 'rate': 0.22},
+            {'min': 100525, 'max': 191950, 'rate': 0.24},
+            {'min': 191950, 'max': 243725, 'rate': 0.32},
+            {'min': 243725, 'max': 609350, 'rate': 0.35},
+            {'min': 609350, 'max': None, 'rate': 0.37},
+        ]
+        
+        # Federal LTCG (Single)
+        ltcg_single = [
+            {'min': 0, 'max': 47025, 'rate': 0.00},
+            {'min': 47025, 'max': 518900, 'rate': 0.15},
+            {'min': 518900, 'max': None, 'rate': 0.20},
+        ]
+        
+        # California (Single)
+        ca_single = [
+            {'min': 0, 'max': 10412, 'rate': 0.01},
+            {'min': 10412, 'max': 24684, 'rate': 0.02},
+            {'min': 24684, 'max': 38959, 'rate': 0.04},
+            {'min': 38959, 'max': 54081, 'rate': 0.06},
+            {'min': 54081, 'max': 68350, 'rate': 0.08},
+            {'min': 68350, 'max': 349137, 'rate': 0.093},
+            {'min': 349137, 'max': 418961, 'rate': 0.103},
+            {'min': 418961, 'max': 698271, 'rate': 0.113},
+            {'min': 698271, 'max': None, 'rate': 0.123},
+        ]
+        
+        bracket_sets = [
+            ('federal', 'ordinary', federal_single),
+            ('federal', 'capital_gains_long', ltcg_single),
+            ('CA', 'ordinary', ca_single),
+        ]
+        
+        # One query for the years already populated, then a single bulk INSERT
+        populated_years = {year for (year,) in db.session.query(TaxBracket.tax_year).filter(
+            TaxBracket.tax_year.in_(years_to_populate)
+        ).distinct()}
+        
+        new_brackets = [
+            {
+                'jurisdiction': jurisdiction, 'tax_year': year, 'filing_status': 'single',
+                'tax_type': tax_type, 'income_min': b['min'], 'income_max': b['max'], 'rate': b['rate']
+            }
+            for year in years_to_populate if year not in populated_years
+            for jurisdiction, tax_type, brackets in bracket_sets
+            for b in brackets
+        ]
+        if new_brackets:
+            db.session.bulk_insert_mappings(TaxBracket, new_brackets)
         
         db.session.commit()
         total_count = TaxBracket.query.count()
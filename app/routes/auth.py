@@ -6,16 +6,20 @@ Security enhanced with rate limiting, CSRF protection, and audit logging.
 from flask import Blueprint, render_template, redirect, url_for, flash, request, abort
 from flask_login import login_user, logout_user, current_user
 from app import db
-from app.models.user import User
+from app.models.user import User, PASSWORD_HASH_METHOD
 from app.utils.password_security import validate_password
 from app.utils.audit_log import AuditLogger
-from werkzeug.security import generate_password_hash
+from werkzeug.security import generate_password_hash, check_password_hash
 import secrets
 from datetime import datetime, timedelta
 from email_validator import validate_email, EmailNotValidError
 
 auth_bp = Blueprint('auth', __name__, url_prefix='/auth')
 
+# Hash checked when the username doesn't exist, so unknown and known users
+# cost the same and response time doesn't reveal which usernames are taken
+_DUMMY_PASSWORD_HASH = generate_password_hash(secrets.token_urlsafe(16), method=PASSWORD_HASH_METHOD)
+
 
 @auth_bp.route('/login', methods=['GET', 'POST'])
 def login():
@@ -34,9 +38,12 @@ def login():
             flash('Username and password are required', 'error')
             return render_template('auth/login.html')
         
-        # Sanitize username (prevent enumeration timing attacks)
         user = User.query.filter_by(username=username).first()
         
+        # Always verify a hash (prevent enumeration timing attacks)
+        if user is None:
+            check_password_hash(_DUMMY_PASSWORD_HASH, password)
+        
         if user and user.check_password(password):
             # Check if account is locked
             if hasattr(user, 'is_locked') and user.is_locked:
@@ -119,14 +126,14 @@ def register():
             if not is_valid:
                 errors.extend(pwd_errors)
         
-        # Check existing users
-        if User.query.filter_by(username=username).first():
+        # Check existing users (existence only - no need to load the rows)
+        if db.session.query(User.query.filter_by(username=username).exists()).scalar():
             errors.append('Username already exists')
             AuditLogger.log_security_event('REGISTRATION_DUPLICATE_USERNAME', {
                 'username': username
             })
         
-        if User.query.filter_by(email=email).first():
+        if db.session.query(User.query.filter_by(email=email).exists()).scalar():
             errors.append('Email already registered')
             AuditLogger.log_security_event('REGISTRATION_DUPLICATE_EMAIL', {
                 'email': email
@@ -5,7 +5,7 @@ Grant management routes - view, add, edit, delete grants.
 from flask import Blueprint, render_template, redirect, url_for, flash, request, jsonify, current_app as app
 from flask_login import login_required, current_user
 from app import db
-from app.models.grant import Grant, GrantType, ShareType
+from app.models.grant import Grant, GrantType, ShareType, ISO_SHARE_TYPES, ESPP_GRANT_TYPES
 from app.models.vest_event import VestEvent
 from app.models.stock_price import StockPrice
 from app.models.sale_plan import SalePlan
@@ -66,8 +66,6 @@ def add_grant():
             # Get stock price at grant date from user's encrypted prices
             share_price = 0.0
             # Debug logging for stock price retrieval
-            import logging
-            logger = logging.getLogger(__name__)
 
             try:
                 from app.models.user_price import UserPrice
@@ -138,6 +136,7 @@ def add_grant():
                 )
                 db.session.add(vest_event)
             
+            VestEvent.refresh_vest_cache(current_user.id, current_user.get_decrypted_user_key())
             db.session.commit()
             flash('Grant added successfully!', 'success')
             return redirect(url_for('grants.list_grants'))
@@ -163,6 +162,8 @@ def view_grant(grant_id):
         return redirect(url_for('grants.list_grants'))
     
     vest_events = VestEvent.query.filter_by(grant_id=grant.id).order_by(VestEvent.vest_date).all()
+    VestEvent.preload_prices(vest_events, current_user.get_decrypted_user_key())
+    VestEvent.preload_values(vest_events)
     
     # Debug: provide the decrypted price pulled via helper for the view
     debug_decrypted_price = get_latest_user_price(grant.user_id, as_of_date=grant.grant_date)
@@ -221,8 +222,7 @@ def edit_grant(grant_id):
             try:
                 share_price = get_latest_user_price(current_user.id, as_of_date=grant_date) or 0.0
             except Exception:
-                import logging
-                logging.getLogger(__name__).exception("Failed to retrieve user price for edit_grant; defaulting to 0.0")
+                logger.exception("Failed to retrieve user price for edit_grant; defaulting to 0.0")
                 share_price = 0.0
             
             # Get vesting configuration
@@ -259,6 +259,7 @@ def edit_grant(grant_id):
                 )
                 db.session.add(vest_event)
             
+            VestEvent.refresh_vest_cache(current_user.id, current_user.get_decrypted_user_key())
             db.session.commit()
             
             flash('Grant updated successfully!', 'success')
@@ -286,8 +287,6 @@ def update_vest_event(event_id):
     
     try:
         # Log incoming form for debugging
-        import logging
-        logger = logging.getLogger(__name__)
         logger.debug(f"update_vest_event called for event_id={event_id} form={dict(request.form)}")
 
         # New simplified tax fields (defensive parsing)
@@ -315,14 +314,13 @@ def update_vest_event(event_id):
                      pass
 
              # As a last resort, log and coerce to 0.0 rather than raising
-             import logging
-             logging.getLogger(__name__).warning("_parse_numeric: could not parse numeric value '%s' - coercing to 0.0", s)
+             logger.warning("_parse_numeric: could not parse numeric value '%s' - coercing to 0.0", s)
              return 0.0
 
         # For ESPP and nqESPP, taxes are already handled prior to receipt
         # So we automatically set cash_paid to 0 and skip validation
         grant = vest_event.grant
-        is_espp_type = grant.grant_type in ['espp', 'nqespp']
+        is_espp_type = grant.grant_type in ESPP_GRANT_TYPES
         
         if is_espp_type:
             cash_paid = 0.0
@@ -352,6 +350,7 @@ def update_vest_event(event_id):
         vest_event.cash_paid = cash_paid
         vest_event.cash_covered_all = cash_covered_all
         vest_event.shares_sold = 0.0 if cash_covered_all else shares_sold
+        vest_event.cache_vest_values()
         
         # Commit to database
         db.session.add(vest_event)
@@ -379,7 +378,6 @@ def update_vest_event(event_id):
     except Exception as e:
         db.session.rollback()
         import traceback
-        logger = logging.getLogger(__name__)
         logger.error(f"ERROR: Failed to update vest event {event_id}: {e}", exc_info=True)
         tb = traceback.format_exc()
         # Return error detail for debugging (remove in production)
@@ -392,14 +390,13 @@ def vest_schedule():
     """View complete vesting schedule."""
     from app.utils.price_utils import get_latest_user_price
     from datetime import date
-    from sqlalchemy.orm import joinedload
     
     # Eagerly load grant relationship to avoid N+1 queries
-    vest_events = VestEvent.query.options(
-        joinedload(VestEvent.grant)
-    ).join(Grant).filter(
+    vest_events = VestEvent.query_with_relations().filter(
         Grant.user_id == current_user.id
     ).order_by(VestEvent.vest_date).all()
+    VestEvent.preload_prices(vest_events, current_user.get_decrypted_user_key())
+    VestEvent.preload_values(vest_events)
     
     # Get latest stock price for estimating future vests
     latest_stock_price = get_latest_user_price(current_user.id) or 0.0
@@ -407,13 +404,13 @@ def vest_schedule():
     
     # Enrich vest events with tax estimates (now uses user's simple tax preferences)
     enriched_events = []
+    future_events = [ve for ve in vest_events if ve.vest_date > today]
+    future_taxes = VestEvent.estimate_tax_withholding_batch(future_events, latest_stock_price)
+    estimated_taxes = {ve.id: tax_info['tax_amount'] for ve, tax_info in zip(future_events, future_taxes)}
     for ve in vest_events:
-        # For future vests, calculate estimated tax using user's tax preferences
-        if ve.vest_date > today:
-            tax_info = ve.estimate_tax_withholding(latest_stock_price)
-            ve.estimated_tax = tax_info['tax_amount']
-        else:
-            ve.estimated_tax = None  # Use actual tax_withheld for vested events
+        # For future vests, use estimated tax from user's tax preferences;
+        # vested events use actual tax_withheld (None here)
+        ve.estimated_tax = estimated_taxes.get(ve.id)
         enriched_events.append(ve)
     
     return render_template('grants/schedule.html', vest_events=enriched_events)
@@ -423,17 +420,15 @@ def vest_schedule():
 @login_required
 def needs_tax_info():
     """Show vests that need tax information."""
-    from sqlalchemy.orm import joinedload
-    
     # Get all vested events that need tax info
-    all_vest_events = VestEvent.query.options(
-        joinedload(VestEvent.grant)
-    ).join(Grant).filter(
+    all_vest_events = VestEvent.query_with_relations().filter(
         Grant.user_id == current_user.id
     ).order_by(VestEvent.vest_date.desc()).all()
     
     # Filter to only vested events that need info
     vests_needing_info = [v for v in all_vest_events if v.has_vested and v.needs_tax_info]
+    VestEvent.preload_prices(vests_needing_info, current_user.get_decrypted_user_key())
+    VestEvent.preload_values(vests_needing_info)
     
     return render_template('grants/needs_tax_info.html', vest_events=vests_needing_info)
 
@@ -449,9 +444,7 @@ def rules():
 @login_required
 def finance_deep_dive():
     """Comprehensive tax and capital gains analysis."""
-    import logging
     from sqlalchemy.orm import joinedload
-    logger = logging.getLogger(__name__)
 
     # Get all grants with eager loading of vest events
     grants = Grant.query.options(
@@ -459,11 +452,17 @@ def finance_deep_dive():
     ).filter_by(user_id=current_user.id).all()
     
     # Get all vest events with eager loading of grants
-    all_vest_events = VestEvent.query.options(
-        joinedload(VestEvent.grant)
-    ).join(Grant).filter(
+    all_vest_events = VestEvent.query_with_relations().filter(
         Grant.user_id == current_user.id
     ).order_by(VestEvent.vest_date).all()
+    VestEvent.preload_prices(all_vest_events, current_user.get_decrypted_user_key())
+    VestEvent.preload_values(all_vest_events)
+    
+    # Comprehensive tax breakdown for ALL events (vested and unvested) in one pass
+    tax_breakdowns = dict(zip(
+        (ve.id for ve in all_vest_events),
+        VestEvent.bulk_tax_breakdowns(all_vest_events)
+    ))
     
     # Get user's tax rates from simple preferences
     tax_rates = current_user.get_tax_rates()
@@ -478,6 +477,12 @@ def finance_deep_dive():
     latest_stock_price = get_latest_user_price(current_user.id) or 0.0
     logger.debug(f"Using latest_stock_price={latest_stock_price} for user {current_user.id}")
 
+    # Withholding estimates for every event in one call
+    tax_estimates = dict(zip(
+        (ve.id for ve in all_vest_events),
+        VestEvent.estimate_tax_withholding_batch(all_vest_events, latest_stock_price)
+    ))
+
     today = date.today()
 
     # Initialize totals
@@ -517,11 +522,10 @@ def finance_deep_dive():
         for ve in vest_events:
             has_vested = ve.vest_date <= today
             
-            # Calculate estimated taxes using user's simple tax preferences
-            tax_info = ve.estimate_tax_withholding(latest_stock_price)
+            # Estimated taxes using user's simple tax preferences (batched above)
+            tax_info = tax_estimates[ve.id]
             
-            # Get comprehensive tax breakdown for ALL events (vested and unvested)
-            tax_breakdown = ve.get_comprehensive_tax_breakdown()
+            tax_breakdown = tax_breakdowns[ve.id]
             
             # Use centralized method to calculate sale tax estimate
             # This is the SINGLE SOURCE OF TRUTH for sale tax calculations
@@ -532,15 +536,15 @@ def finance_deep_dive():
             )
             
             # Extract values from centralized calculation
-            shares_held = sale_tax_data['shares_held']
-            cost_basis_per_share = sale_tax_data['cost_basis_per_share']
-            cost_basis = sale_tax_data['cost_basis']
-            current_value = sale_tax_data['current_value']
-            unrealized_gain = sale_tax_data['unrealized_gain']
-            days_held = sale_tax_data['days_held']
-            is_long_term = sale_tax_data['is_long_term']
-            holding_period = sale_tax_data['holding_period']
-            estimated_tax = sale_tax_data['estimated_tax']
+            shares_held = sale_tax_data.shares_held
+            cost_basis_per_share = sale_tax_data.cost_basis_per_share
+            cost_basis = sale_tax_data.cost_basis
+            current_value = sale_tax_data.current_value
+            unrealized_gain = sale_tax_data.unrealized_gain
+            days_held = sale_tax_data.days_held
+            is_long_term = sale_tax_data.is_long_term
+            holding_period = sale_tax_data.holding_period
+            estimated_tax = sale_tax_data.estimated_tax
 
             
             ve_data = {
@@ -602,9 +606,6 @@ def finance_deep_dive():
         total_unrealized_gain_all += grant_unrealized_gain_all
         total_estimated_tax += grant_estimated_tax_on_sale
     
-    # Debug logging for calculated totals
-    logger = logging.getLogger(__name__)
-
     # Debug logging for calculated totals
     logger.debug(f"Total Shares Held (Vested): {total_shares_held_vested}")
     logger.debug(f"Total Shares Held (All): {total_shares_held_all}")
@@ -635,7 +636,7 @@ def finance_deep_dive():
 @login_required
 def vest_detail(vest_id):
     """View and edit details for a specific vest event."""
-    from app.models.vest_event import VestEvent
+    from app.models.vest_event import VestEvent, VestData
     from app.models.stock_sale import StockSale, ISOExercise
     
     try:
@@ -701,42 +702,54 @@ def vest_detail(vest_id):
                 exercises_data=exercises
             )
             logger.info(f"✓ get_complete_data SUCCESS")
-            logger.info(f"  Keys in vest_data: {list(vest_data.keys())}")
-            logger.info(f"  vest_id: {vest_data.get('vest_id')}")
-            logger.info(f"  has_vested: {vest_data.get('has_vested')}")
-            logger.info(f"  is_iso: {vest_data.get('is_iso')}")
-            logger.info(f"  price_at_vest: {vest_data.get('price_at_vest')}")
-            logger.info(f"  shares_vested: {vest_data.get('shares_vested')}")
-            if 'error' in vest_data:
-                logger.error(f"  ERROR IN VEST_DATA: {vest_data['error']}")
-                flash(f"Warning: Some calculations unavailable: {vest_data['error']}", 'warning')
+            logger.info(f"  vest_id: {vest_data.vest_id}")
+            logger.info(f"  has_vested: {vest_data.has_vested}")
+            logger.info(f"  is_iso: {vest_data.is_iso}")
+            logger.info(f"  price_at_vest: {vest_data.price_at_vest}")
+            logger.info(f"  shares_vested: {vest_data.shares_vested}")
+            if vest_data.error:
+                logger.error(f"  ERROR IN VEST_DATA: {vest_data.error}")
+                flash(f"Warning: Some calculations unavailable: {vest_data.error}", 'warning')
         except Exception as e:
             logger.error(f"✗ EXCEPTION in get_complete_data: {e}", exc_info=True)
             # Create minimal vest_data to prevent template errors
-            vest_data = {
-                'vest_id': vest_event.id,
-                'has_vested': vest_event.has_vested,
-                'is_iso': vest_event.grant.share_type in ['iso_5y', 'iso_6y'],
-                'is_cash': vest_event.grant.share_type == 'cash',
-                'shares_vested': vest_event.shares_vested,
-                'price_at_vest': 0.0,
-                'gross_value': 0.0,
-                'shares_received': vest_event.shares_received,
-                'net_value': 0.0,
-                'current_price': 0.0,
-                'strike_price': vest_event.grant.share_price_at_grant if vest_event.grant.share_type in ['iso_5y', 'iso_6y'] else None,
-                'cost_basis_per_share': 0.0,
-                'shares_sold': 0.0,
-                'shares_exercised': 0.0,
-                'shares_remaining': vest_event.shares_received,
-                'tax_breakdown': None,
-                'sale_tax_projection': None,
-                'error': str(e)
-            }
+            is_iso = vest_event.grant.share_type in ISO_SHARE_TYPES
+            vest_data = VestData(
+                vest_id=vest_event.id,
+                vest_date=vest_event.vest_date,
+                has_vested=vest_event.has_vested,
+                is_iso=is_iso,
+                is_cash=vest_event.grant.share_type == 'cash',
+                grant_type=vest_event.grant.grant_type,
+                share_type=vest_event.grant.share_type,
+                shares_vested=vest_event.shares_vested,
+                shares_withheld_for_taxes=0.0,
+                shares_received=vest_event.shares_received,
+                shares_sold=0.0,
+                shares_exercised=0.0,
+                shares_remaining=vest_event.shares_received,
+                price_at_vest=0.0,
+                current_price=0.0,
+                strike_price=vest_event.grant.share_price_at_grant if is_iso else None,
+                cost_basis_per_share=0.0,
+                gross_value=0.0,
+                tax_withheld_value=0.0,
+                net_value=0.0,
+                current_market_value=0.0,
+                total_cost_basis=0.0,
+                unrealized_gain=0.0,
+                cash_paid=vest_event.cash_paid or 0.0,
+                cash_covered_all=vest_event.cash_covered_all or False,
+                tax_breakdown=None,
+                sale_tax_projection=None,
+                notes=vest_event.notes,
+                needs_tax_info=False,
+                error=str(e)
+            )
             flash(f'Warning: Some calculations unavailable: {str(e)}', 'warning')
         
         logger.info("Rendering template with vest_data")
-        logger.info(f"  Template vars: vest_event={vest_event.id}, grant={vest_event.grant.id if vest_event.grant else None}, vest_data keys={list(vest_data.keys())}, sales={len(sales)}, exercises={len(exercises)}")
+        logger.info(f"  Template vars: vest_event={vest_event.id}, grant={vest_event.grant.id if vest_event.grant else None}, vest_data fields={len(vest_data._fields)}, sales={len(sales)}, exercises={len(exercises)}")
         return render_template('grants/vest_detail.html',
                              vest_event=vest_event,
                              grant=vest_event.grant,
@@ -756,9 +769,11 @@ def vest_detail(vest_id):
 def sale_planning():
     """Sale planning interface - drag/drop vests into years to optimize taxes"""
     # Get all vest events (vested and unvested)
-    vest_events = VestEvent.query.join(Grant).filter(
+    vest_events = VestEvent.query_with_relations().filter(
         Grant.user_id == current_user.id
     ).order_by(VestEvent.vest_date).all()
+    VestEvent.preload_prices(vest_events, current_user.get_decrypted_user_key())
+    VestEvent.preload_values(vest_events)
     
     # Get current stock price
     latest_stock_price = get_latest_user_price(current_user.id) or 0.0
@@ -840,7 +855,7 @@ def calculate_sale_taxes():
         year = int(data.get('year'))
         vest_ids = data.get('vest_ids', [])
         
-        logging.debug(f"Calculating taxes for year {year} with {len(vest_ids)} vests")
+        logger.debug("Calculating taxes for year %s with %d vests", year, len(vest_ids))
         
         # Handle empty vest list
         if not vest_ids:
@@ -860,7 +875,7 @@ def calculate_sale_taxes():
             })
         
         # Get vests
-        vests = VestEvent.query.filter(VestEvent.id.in_(vest_ids)).all()
+        vests = VestEvent.query_with_relations().filter(VestEvent.id.in_(vest_ids)).all()
         
         if not vests:
             return jsonify({'success': False, 'error': 'No vests found'}), 400
@@ -922,9 +937,9 @@ def calculate_sale_taxes():
             'stcg_rate': stcg_rate * 100
         }
         
-        logging.debug(f"Result: proceeds=${total_proceeds:.2f}, tax=${total_tax:.2f}, net=${net_proceeds:.2f}")
+        logger.debug("Result: proceeds=$%.2f, tax=$%.2f, net=$%.2f", total_proceeds, total_tax, net_proceeds)
         return jsonify(result)
         
     except Exception as e:
-        logging.error(f"Error in calculate_sale_taxes: {str(e)}", exc_info=True)
+        logger.error("Error in calculate_sale_taxes: %s", e, exc_info=True)
         return jsonify({'success': False, 'error': str(e)}), 400
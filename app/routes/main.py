@@ -4,7 +4,7 @@ Main application routes - dashboard, home page.
 
 from flask import Blueprint, render_template, redirect, url_for, jsonify
 from flask_login import login_required, current_user
-from app.models.grant import Grant
+from app.models.grant import Grant, ISO_SHARE_TYPES
 from app.models.vest_event import VestEvent
 from datetime import date
 
@@ -37,14 +37,16 @@ def dashboard():
     # For total value, sum up each grant's current_value (which handles ISO spread correctly)
     total_value = sum(g.current_value for g in grants)
     
+    today = date.today()
+    
     # Get upcoming vests (vest_date in the future)
-    upcoming_vests = VestEvent.query.join(Grant).filter(
+    upcoming_vests = VestEvent.query_with_relations().filter(
         Grant.user_id == current_user.id,
-        VestEvent.vest_date >= date.today()
+        VestEvent.vest_date >= today
     ).order_by(VestEvent.vest_date).limit(5).all()
     
     # Get ALL vest events and filter by has_vested property (vest_date in the past)
-    all_vest_events = VestEvent.query.join(Grant).filter(
+    all_vest_events = VestEvent.query_with_relations().filter(
         Grant.user_id == current_user.id
     ).order_by(VestEvent.vest_date).all()
     
@@ -60,7 +62,7 @@ def dashboard():
     
     # Build comprehensive timeline with ALL state changes (stock price updates + vest events)
     from app.models.user_price import UserPrice
-    from app.utils.encryption import decrypt_for_user
+    from app.utils.encryption import decrypt_for_user_cached
     
     # Get user's encrypted prices and decrypt them
     all_user_prices = UserPrice.query.filter_by(user_id=current_user.id).order_by(UserPrice.valuation_date).all()
@@ -69,7 +71,7 @@ def dashboard():
         user_key = current_user.get_decrypted_user_key()
         for price_entry in all_user_prices:
             try:
-                price_str = decrypt_for_user(user_key, price_entry.encrypted_price)
+                price_str = decrypt_for_user_cached(user_key, price_entry.encrypted_price)
                 price_val = float(price_str)
                 all_stock_prices.append({
                     'valuation_date': price_entry.valuation_date,
@@ -113,52 +115,48 @@ def dashboard():
     cumulative_total_shares = 0
     current_price = 0
     
+    # Running sums over every vest seen so far, so a price change revalues
+    # them in O(1): value = price × shares - Σ(ISO shares × strike)
+    seen_total_shares = 0
+    seen_total_strike_cost = 0
+    seen_vested_shares = 0
+    seen_vested_strike_cost = 0
+    
     for event in timeline_events:
         event_date = event['date']
         
         # Update price if this is a price update
         if event['type'] == 'price_update':
-            # Recalculate all cumulative values with new price
-            # This is necessary because ISOs use spread (price - strike)
+            # Revalue everything vested up to this date at the new price
+            # (ISOs use spread, hence the strike cost term)
             current_price = event['price']
-            
-            # Recalculate from scratch when price changes
-            cumulative_vested_value = 0
-            cumulative_total_value = 0
-            
-            for vest in all_vest_events:
-                if vest.vest_date <= event_date:
-                    grant = vest.grant
-                    shares = vest.shares_vested
-                    
-                    if grant.share_type in ['iso_5y', 'iso_6y']:
-                        value = shares * (current_price - grant.share_price_at_grant)
-                    else:
-                        value = shares * current_price
-                    
-                    cumulative_total_value += value
-                    if vest.has_vested:
-                        cumulative_vested_value += value
+            cumulative_total_value = current_price * seen_total_shares - seen_total_strike_cost
+            cumulative_vested_value = current_price * seen_vested_shares - seen_vested_strike_cost
         
         # Process vest event
         elif event['type'] == 'vest':
             vest = event['vest']
             grant = vest.grant
             shares = vest.shares_vested
+            strike_cost = shares * grant.share_price_at_grant if grant.share_type in ISO_SHARE_TYPES else 0
+            is_vested = vest.has_vested
+            
+            seen_total_shares += shares
+            seen_total_strike_cost += strike_cost
+            if is_vested:
+                seen_vested_shares += shares
+                seen_vested_strike_cost += strike_cost
             
             # Use most recent price
             if not current_price:
                 continue
             
-            if grant.share_type in ['iso_5y', 'iso_6y']:
-                value = shares * (current_price - grant.share_price_at_grant)
-            else:
-                value = shares * current_price
+            value = shares * current_price - strike_cost
             
             cumulative_total_value += value
             cumulative_total_shares += shares
             
-            if vest.has_vested:
+            if is_vested:
                 cumulative_vested_value += value
                 cumulative_vested_shares += shares
         
@@ -170,7 +168,7 @@ def dashboard():
                 'total_shares': cumulative_total_shares,
                 'vested_value': cumulative_vested_value,
                 'total_value': cumulative_total_value,
-                'is_vested': event_date <= date.today(),
+                'is_vested': event_date <= today,
                 'price_at_date': current_price,
                 'event_type': event['type']
             })
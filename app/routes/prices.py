@@ -2,7 +2,9 @@ from flask import Blueprint, request, jsonify, current_app, render_template, red
 from flask_login import login_required, current_user
 from app import db
 from app.models.user_price import UserPrice
+from app.models.vest_event import VestEvent
 from app.utils.encryption import encrypt_for_user, decrypt_for_user
+from app.utils.price_utils import invalidate_user_price_cache
 from app.utils.audit_log import AuditLogger
 
 prices_bp = Blueprint('prices', __name__, url_prefix='/user/prices')
@@ -61,6 +63,9 @@ def add_price():
     token = encrypt_for_user(user_key, str(price_float))
     up = UserPrice(user_id=current_user.id, valuation_date=valuation_date, encrypted_price=token)
     db.session.add(up)
+    VestEvent.invalidate_vest_cache(current_user.id, from_date=valuation_date)
+    invalidate_user_price_cache(current_user.id)
+    VestEvent.refresh_vest_cache(current_user.id, user_key)
     db.session.commit()
     AuditLogger.log_security_event('USER_PRICE_ADDED', {'user_id': current_user.id, 'price_id': up.id, 'date': up.valuation_date.isoformat()})
     if request.is_json:
@@ -73,7 +78,10 @@ def add_price():
 @login_required
 def delete_price(price_id):
     p = UserPrice.query.filter_by(id=price_id, user_id=current_user.id).first_or_404()
+    VestEvent.invalidate_vest_cache(current_user.id, from_date=p.valuation_date)
+    invalidate_user_price_cache(current_user.id)
     db.session.delete(p)
+    VestEvent.refresh_vest_cache(current_user.id, current_user.get_decrypted_user_key())
     db.session.commit()
     AuditLogger.log_security_event('USER_PRICE_DELETED', {'user_id': current_user.id, 'price_id': price_id})
     flash('Price deleted successfully!', 'success')
@@ -123,8 +131,11 @@ def edit_price(price_id):
     user_key = current_user.get_decrypted_user_key()
     token = encrypt_for_user(user_key, str(price_float))
     
+    VestEvent.invalidate_vest_cache(current_user.id, from_date=min(p.valuation_date, valuation_date))
+    invalidate_user_price_cache(current_user.id)
     p.valuation_date = valuation_date
     p.encrypted_price = token
+    VestEvent.refresh_vest_cache(current_user.id, user_key)
     db.session.commit()
     
     AuditLogger.log_security_event('USER_PRICE_UPDATED', {'user_id': current_user.id, 'price_id': p.id, 'date': p.valuation_date.isoformat()})
@@ -6,7 +6,7 @@ from flask import Blueprint, render_template, request, jsonify, flash, redirect,
 from flask_login import login_required, current_user
 from app import db
 from app.models.stock_sale import StockPriceScenario, ScenarioPricePoint
-from app.models.grant import Grant
+from app.models.grant import Grant, ISO_SHARE_TYPES
 from app.models.vest_event import VestEvent
 from datetime import datetime, date
 import logging
@@ -22,7 +22,7 @@ def price_scenarios():
     scenarios = StockPriceScenario.query.filter_by(user_id=current_user.id).all()
     
     # Get all unvested events to show impact
-    unvested_events = VestEvent.query.join(Grant).filter(
+    unvested_events = VestEvent.query_with_relations().filter(
         Grant.user_id == current_user.id,
         VestEvent.vest_date > date.today()
     ).order_by(VestEvent.vest_date).all()
@@ -206,7 +206,7 @@ def get_scenario_projection(scenario_id):
         ).first_or_404()
         
         # Get current vested shares (already owned)
-        vested_events = VestEvent.query.join(Grant).filter(
+        vested_events = VestEvent.query_with_relations().filter(
             and_(
                 Grant.user_id == current_user.id,
                 VestEvent.vest_date <= date.today()
@@ -225,7 +225,7 @@ def get_scenario_projection(scenario_id):
         
         # Get all unvested events (future)
         from sqlalchemy import and_
-        unvested_events = VestEvent.query.join(Grant).filter(
+        unvested_events = VestEvent.query_with_relations().filter(
             and_(
                 Grant.user_id == current_user.id,
                 VestEvent.vest_date > date.today()
@@ -245,7 +245,7 @@ def get_scenario_projection(scenario_id):
         if actual_current_price:
             for grant_id, shares in vested_shares_by_grant.items():
                 grant = Grant.query.get(grant_id)
-                if grant.share_type in ['iso_5y', 'iso_6y']:
+                if grant.share_type in ISO_SHARE_TYPES:
                     value_per_share = max(0, actual_current_price - grant.share_price_at_grant)
                 else:
                     value_per_share = actual_current_price
@@ -280,7 +280,7 @@ def get_scenario_projection(scenario_id):
                 if projected_price is not None:
                     # For ISOs, use spread (price - strike)
                     grant = vest.grant
-                    if grant.share_type in ['iso_5y', 'iso_6y']:
+                    if grant.share_type in ISO_SHARE_TYPES:
                         value_per_share = max(0, projected_price - grant.share_price_at_grant)
                     else:
                         value_per_share = projected_price
@@ -333,7 +333,7 @@ def compare_scenarios():
         ).all()
         
         # Get unvested events
-        unvested_events = VestEvent.query.join(Grant).filter(
+        unvested_events = VestEvent.query_with_relations().filter(
             Grant.user_id == current_user.id,
             VestEvent.vest_date > date.today()
         ).order_by(VestEvent.vest_date).all()
@@ -348,7 +348,7 @@ def compare_scenarios():
                 
                 if projected_price:
                     grant = vest.grant
-                    if grant.share_type in ['iso_5y', 'iso_6y']:
+                    if grant.share_type in ISO_SHARE_TYPES:
                         value_per_share = max(0, projected_price - grant.share_price_at_grant)
                     else:
                         value_per_share = projected_price
@@ -36,7 +36,7 @@ def transactions_page():
         logger.warning(f"Could not load transactions: {e}")
     
     # Get available vests for dropdowns
-    vests = VestEvent.query.join(Grant).filter(
+    vests = VestEvent.query_with_relations().filter(
         Grant.user_id == current_user.id,
         VestEvent.vest_date <= date.today()
     ).order_by(VestEvent.vest_date.desc()).all()
@@ -0,0 +1,52 @@
+"""
+Script to populate cached price/value at vest for already-vested events.
+Safe to re-run: only events without a cached price are touched.
+"""
+
+import logging
+from datetime import date
+
+from app import create_app, db
+from app.models.grant import Grant
+from app.models.user import User
+from app.models.vest_event import VestEvent
+
+logger = logging.getLogger(__name__)
+
+
+def backfill_vest_cache():
+    """Fill price_at_vest_cached / value_at_vest_cached for every vested event."""
+    app = create_app()
+    
+    with app.app_context():
+        users = User.query.filter(User.encrypted_user_key.isnot(None)).all()
+        total = 0
+        
+        for user in users:
+            # Same as-of lookup as the write paths: an undecryptable price row
+            # still shadows older ones, so its vests are left uncached
+            try:
+                filled = VestEvent.refresh_vest_cache(user.id, user.get_decrypted_user_key())
+                db.session.commit()
+            except Exception as e:
+                db.session.rollback()
+                logger.error("Skipping user %s: %s", user.id, e)
+                continue
+            total += filled
+            
+            skipped = VestEvent.query.join(Grant).filter(
+                Grant.user_id == user.id,
+                VestEvent.vest_date <= date.today(),
+                VestEvent.price_at_vest_cached.is_(None)
+            ).with_entities(VestEvent.id).all()
+            for (vest_id,) in skipped:
+                logger.warning("User %s: no usable price for vest %s, left uncached", user.id, vest_id)
+            
+            if filled:
+                print(f"User #{user.id}: cached {filled} vested events")
+        
+        print(f"\n✅ Cached values for {total} vest events")
+
+
+if __name__ == '__main__':
+    backfill_vest_cache()
@@ -15,6 +15,7 @@ This module exposes helpers to generate per-user keys and to encrypt/decrypt blo
 from __future__ import annotations
 
 from cryptography.fernet import Fernet, InvalidToken
+from flask import g, has_app_context
 import os
 from typing import Optional
 
@@ -106,6 +107,23 @@ def decrypt_for_user(user_key: bytes, token: bytes) -> str:
         raise EncryptionError('Failed to decrypt user token (invalid token)')
 
 
+def decrypt_for_user_cached(user_key: bytes, token: bytes) -> str:
+    """Like decrypt_for_user, but remembers plaintexts for the rest of the request.
+
+    Pages that read the same price rows through several paths (dashboard
+    timeline, latest-price lookup, per-vest prices) decrypt each token once.
+    Failures are not cached and raise EncryptionError as usual.
+    """
+    if not has_app_context():
+        return decrypt_for_user(user_key, token)
+    cache = g.setdefault('_decrypted_user_tokens', {})
+    key = (user_key, token)
+    plaintext = cache.get(key)
+    if plaintext is None:
+        plaintext = cache[key] = decrypt_for_user(user_key, token)
+    return plaintext
+
+
 def generate_master_key_command() -> str:
     """Return a shell command string to generate and export a new master key (zsh).
 
@@ -0,0 +1,36 @@
+"""
+Migration utility to add composite indexes to vest_events and user_prices tables.
+db.create_all() only creates indexes for new tables, so existing
+databases need them added explicitly.
+"""
+
+from sqlalchemy import text
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def migrate_vest_indexes(app):
+    """Create composite vest_events / user_prices indexes if they don't exist."""
+    from app import db
+    
+    try:
+        db.session.execute(text("""
+            CREATE INDEX IF NOT EXISTS ix_vest_events_grant_vestdate
+            ON vest_events (grant_id, vest_date)
+        """))
+        db.session.execute(text("""
+            CREATE INDEX IF NOT EXISTS ix_vest_events_grant_taxyear
+            ON vest_events (grant_id, tax_year)
+        """))
+        db.session.execute(text("""
+            CREATE INDEX IF NOT EXISTS ix_user_prices_user_date
+            ON user_prices (user_id, valuation_date)
+        """))
+        db.session.commit()
+        logger.info("✓ vest_events / user_prices composite indexes ensured")
+        
+    except Exception as e:
+        db.session.rollback()
+        logger.error(f"Migration failed: {e}", exc_info=True)
+        # Don't raise - allow app to continue
@@ -0,0 +1,32 @@
+"""
+Migration utility to add cached price/value columns to vest_events table.
+"""
+
+from sqlalchemy import text
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def migrate_vest_price_cache(app):
+    """Add price_at_vest_cached / value_at_vest_cached columns if they don't exist."""
+    from app import db
+    
+    try:
+        result = db.session.execute(text('SELECT price_at_vest_cached FROM vest_events LIMIT 1'))
+        result.close()
+        logger.info("✓ vest price cache columns already exist")
+        return
+    except Exception as e:
+        db.session.rollback()
+        logger.info(f"vest price cache columns missing, attempting to add: {e}")
+    
+    try:
+        db.session.execute(text('ALTER TABLE vest_events ADD COLUMN price_at_vest_cached FLOAT'))
+        db.session.execute(text('ALTER TABLE vest_events ADD COLUMN value_at_vest_cached FLOAT'))
+        db.session.commit()
+        logger.info("✓ vest price cache migration successful!")
+    except Exception as e:
+        db.session.rollback()
+        logger.error(f"Migration failed: {e}", exc_info=True)
+        # Don't raise - allow app to continue
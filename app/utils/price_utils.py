@@ -14,49 +14,77 @@ from typing import Optional
 from datetime import date
 import logging
 
+from flask import g, has_app_context
 from flask_login import current_user
 
 from app.models.user_price import UserPrice
-from app.utils.encryption import decrypt_for_user
+from app.utils.encryption import decrypt_for_user_cached
 
 logger = logging.getLogger(__name__)
 
 
+def _fetch_user_price(user_id: int, as_of_date: date) -> Optional[float]:
+    """Decrypt the single latest price row for ``user_id`` on or before ``as_of_date``.
+
+    One indexed query (valuation_date <= as_of, newest first, LIMIT 1) and at
+    most one decrypt. An undecryptable latest row yields None rather than
+    falling back to an older price.
+    """
+    price_entry = UserPrice.query.filter(
+        UserPrice.user_id == user_id,
+        UserPrice.valuation_date <= as_of_date
+    ).order_by(UserPrice.valuation_date.desc()).first()
+
+    if not price_entry:
+        logger.debug("No UserPrice entry found for user %s on or before %s", user_id, as_of_date)
+        return None
+
+    try:
+        user_key = current_user.get_decrypted_user_key()
+        return float(decrypt_for_user_cached(user_key, price_entry.encrypted_price))
+    except Exception as e:
+        logger.error("Failed to decrypt price %s for user %s: %s", price_entry.id, user_id, e)
+        return None
+
+
+def invalidate_user_price_cache(user_id: int) -> None:
+    """Drop the request's cached price lookups for ``user_id`` (call after editing prices)."""
+    if has_app_context():
+        lookups = g.get('_user_price_lookups', {})
+        for key in [k for k in lookups if k[0] == user_id]:
+            del lookups[key]
+
+
 def get_latest_user_price(user_id: int, as_of_date: Optional[date] = None) -> Optional[float]:
     """Return the latest decrypted user price for ``user_id`` on or before
     ``as_of_date``. If ``as_of_date`` is None, returns the latest price on or before today.
 
     Returns a float price on success or None when no price is found or
-    decryption fails. This intentionally requires the requesting user to be
+    decryption fails. Never raises: unexpected errors (DB, decryption) are
+    logged and reported as None, so callers can treat "no price" and
+    "lookup failed" the same way without their own try/except.
+    This intentionally requires the requesting user to be
     authenticated (uses ``current_user.get_decrypted_user_key()``) just like
     the existing model properties that decrypt prices.
+
+    Each lookup is a single-row query; results are kept on ``flask.g`` per
+    ``(user_id, as_of_date)`` so repeated "latest price" reads in one request
+    (one per grant or vest) hit the database once. Pages that resolve many
+    different vest dates should use ``VestEvent.preload_prices()`` instead.
     """
     try:
-        from datetime import date as date_class
-        
-        # Find the appropriate price entry
-        query = UserPrice.query.filter_by(user_id=user_id)
-        
-        # Always filter to on or before a specific date
-        # If no as_of_date provided, use today to exclude future prices
-        if as_of_date is not None:
-            query = query.filter(UserPrice.valuation_date <= as_of_date)
-        else:
-            query = query.filter(UserPrice.valuation_date <= date_class.today())
-            
-        price_entry = query.order_by(UserPrice.valuation_date.desc()).first()
-
-        if not price_entry:
-            logger.debug("No UserPrice entry found for user %s on or before %s", user_id, as_of_date or "today")
-            return None
-
         if not current_user.is_authenticated or current_user.id != user_id:
             logger.warning("Attempt to decrypt user price for user %s while %s is authenticated", user_id, getattr(current_user, 'id', None))
             return None
 
-        user_key = current_user.get_decrypted_user_key()
-        price_str = decrypt_for_user(user_key, price_entry.encrypted_price)
-        return float(price_str)
+        # Always look up on or before a specific date
+        # If no as_of_date provided, use today to exclude future prices
+        as_of = as_of_date if as_of_date is not None else date.today()
+        lookups = g.setdefault('_user_price_lookups', {}) if has_app_context() else {}
+        key = (user_id, as_of)
+        if key not in lookups:
+            lookups[key] = _fetch_user_price(user_id, as_of)
+        return lookups[key]
 
     except Exception as e:
         logger.error("Failed to retrieve/decrypt price for user %s: %s", user_id, e, exc_info=True)
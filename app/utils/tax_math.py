@@ -0,0 +1,116 @@
+"""
+Tax math for vest events.
+
+Scalar cores for `VestEvent.get_comprehensive_tax_breakdown` and
+`VestEvent.get_estimated_sale_tax`, plus column-oriented batch versions so
+report pages can compute every vest in one pass instead of one method call each.
+"""
+
+# Simplified FICA constants used for vest breakdowns
+SS_WAGE_BASE = 168600
+SS_RATE = 0.062
+MEDICARE_RATE = 0.0145
+ADDITIONAL_MEDICARE_THRESHOLD = 200000  # $200k single, $250k married - simplified to $200k
+ADDITIONAL_MEDICARE_RATE = 0.009
+
+# Simplified capital gains constants used for sale tax estimates
+LTCG_RATE = 0.15  # Long-term: typically 0%, 15% or 20% - 15% is a reasonable default
+NIIT_RATE = 0.038
+NIIT_FEDERAL_RATE_PROXY = 0.32  # Ordinary rate at which we assume NIIT applies
+
+
+def tax_breakdown_core(gross, federal_rate, state_rate, include_fica, ss_wage_base_maxed) -> tuple:
+    """
+    Core arithmetic for a single vest tax breakdown.
+    
+    Returns:
+        (federal_tax, state_tax, social_security_tax, medicare_tax,
+         additional_medicare_tax, social_security_rate, medicare_rate,
+         additional_medicare_rate) - rates are the ones actually applied,
+         0.0 when a component doesn't apply.
+    """
+    federal_tax = gross * federal_rate
+    state_tax = gross * state_rate
+    
+    if not include_fica:
+        return federal_tax, state_tax, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0
+    
+    # Social Security: 6.2% up to wage base (skip if already maxed)
+    # Simplified: assume this vest pushes user over the cap if gross > wage base
+    if ss_wage_base_maxed:
+        ss_rate = 0.0
+        social_security_tax = 0.0
+    else:
+        ss_rate = SS_RATE
+        social_security_tax = min(gross, SS_WAGE_BASE) * ss_rate
+    
+    # Medicare: 1.45% on all income (always applies)
+    medicare_tax = gross * MEDICARE_RATE
+    
+    # Additional Medicare: 0.9% on income over threshold
+    additional_medicare_tax = max(gross - ADDITIONAL_MEDICARE_THRESHOLD, 0.0) * ADDITIONAL_MEDICARE_RATE
+    # Show 0% if not applicable
+    additional_medicare_rate = ADDITIONAL_MEDICARE_RATE if additional_medicare_tax else 0.0
+    
+    return (federal_tax, state_tax, social_security_tax, medicare_tax, additional_medicare_tax,
+            ss_rate, MEDICARE_RATE, additional_medicare_rate)
+
+
+def compute_tax_breakdowns(gross_values, federal_rates, state_rates,
+                           include_fica, ss_wage_base_maxed) -> dict:
+    """
+    Compute vest tax components for many events at once.
+    
+    All arguments are equal-length sequences (one entry per event).
+    
+    Returns:
+        dict of lists keyed like get_comprehensive_tax_breakdown():
+        federal_tax, state_tax, social_security_tax, medicare_tax,
+        additional_medicare_tax, total_fica, total_tax, net_value,
+        social_security_rate, medicare_rate, additional_medicare_rate,
+        effective_rate
+    """
+    keys = ('federal_tax', 'state_tax', 'social_security_tax', 'medicare_tax',
+            'additional_medicare_tax', 'social_security_rate', 'medicare_rate',
+            'additional_medicare_rate')
+    columns = {key: [] for key in keys}
+    columns.update(total_fica=[], total_tax=[], net_value=[], effective_rate=[])
+    appenders = [columns[key].append for key in keys]
+    
+    for gross, fed, state, fica, maxed in zip(gross_values, federal_rates, state_rates,
+                                               include_fica, ss_wage_base_maxed):
+        parts = tax_breakdown_core(gross, fed, state, fica, maxed)
+        for append, value in zip(appenders, parts):
+            append(value)
+        total_fica = parts[2] + parts[3] + parts[4]
+        total_tax = parts[0] + parts[1] + total_fica
+        columns['total_fica'].append(total_fica)
+        columns['total_tax'].append(total_tax)
+        columns['net_value'].append(gross - total_tax)
+        columns['effective_rate'].append(total_tax / gross if gross > 0 else 0.0)
+    
+    return columns
+
+
+def sale_tax_core(unrealized_gain, is_long_term, ordinary_federal_rate, state_rate) -> tuple:
+    """
+    Core arithmetic for the simplified capital gains estimate on a sale.
+    
+    Returns:
+        (federal_rate, federal_tax, state_tax, niit_tax) - federal_rate is the
+        capital gains rate actually applied
+    """
+    # Long-term gains at the LTCG rate; short-term gains taxed as ordinary income
+    federal_rate = LTCG_RATE if is_long_term else ordinary_federal_rate
+    federal_tax = unrealized_gain * federal_rate
+    state_tax = unrealized_gain * state_rate
+    
+    # NIIT (Net Investment Income Tax): 3.8% on investment income for high earners
+    # Applies to single filers with MAGI > $200k, married > $250k
+    # Simplified: apply if federal rate is high (proxy for high earner)
+    if ordinary_federal_rate >= NIIT_FEDERAL_RATE_PROXY:
+        niit_tax = unrealized_gain * NIIT_RATE
+    else:
+        niit_tax = 0.0
+    
+    return federal_rate, federal_tax, state_tax, niit_tax
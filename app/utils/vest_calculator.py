@@ -5,7 +5,7 @@ Vesting schedule calculator for SpaceX stock grants.
 from datetime import date, timedelta
 from dateutil.relativedelta import relativedelta
 from typing import List, Dict, Tuple
-from app.models.grant import Grant, GrantType, ShareType
+from app.models.grant import Grant, GrantType, ShareType, ISO_SHARE_TYPES, ESPP_GRANT_TYPES
 
 import math
 
@@ -133,7 +133,7 @@ def calculate_vest_schedule(grant: Grant) -> List[Dict]:
     
     # Handle ESPP separately (immediate vest on grant date)
     # For ESPP, the grant_date is the actual receipt/vest date
-    if grant.grant_type in [GrantType.ESPP.value, GrantType.NQESPP.value]:
+    if grant.grant_type in ESPP_GRANT_TYPES:
         vest_events.append({
             'vest_date': grant.grant_date,  # ESPP vests immediately on grant date
             'shares': grant.share_quantity,
@@ -144,7 +144,7 @@ def calculate_vest_schedule(grant: Grant) -> List[Dict]:
     # Calculate cliff date
     # For ISOs: cliff is when the FIRST vest happens (after vesting starts + 6 months)
     # For RSUs: Use standard SpaceX vest dates (5/15 or 11/15)
-    if grant.share_type in [ShareType.ISO_5Y.value, ShareType.ISO_6Y.value]:
+    if grant.share_type in ISO_SHARE_TYPES:
         # ISO cliff calculation:
         # - Determine when vesting period starts
         # - Cliff is 6 months after vesting start
@@ -172,7 +172,7 @@ def calculate_vest_schedule(grant: Grant) -> List[Dict]:
         cliff_date = get_closest_vest_date(actual_cliff_date)
     
     # Determine vesting frequency
-    if grant.share_type in [ShareType.ISO_5Y.value, ShareType.ISO_6Y.value]:
+    if grant.share_type in ISO_SHARE_TYPES:
         # Monthly vesting for ISOs
         vest_frequency_months = 1
     else:
@@ -336,7 +336,7 @@ def get_grant_configuration(grant_type: str, share_type: str, bonus_type: str =
         # Can be 1-5 years, default to 1
         return (1, 1.0)
     
-    elif grant_type in [GrantType.ESPP.value, GrantType.NQESPP.value]:
+    elif grant_type in ESPP_GRANT_TYPES:
         return (0, 0)
     
     # Default
@@ -0,0 +1,35 @@
+"""
+Batch dollar-value math for vest events.
+
+Column-oriented versions of `VestEvent.value_at_vest`, `net_value` and
+`tax_withheld`, so list pages can compute every vest's values in one pass
+once prices have been preloaded.
+"""
+
+
+def compute_vest_values(shares_vested, shares_sold, cash_paid, prices, strikes,
+                        is_cash, is_iso) -> list:
+    """
+    Compute gross value, net value and tax withheld for many vests at once.
+
+    All arguments are equal-length sequences (one entry per event). For
+    cash grants share counts are USD amounts and prices/strikes are ignored;
+    strikes only apply to ISOs.
+
+    Returns:
+        list of (gross_value, net_value, tax_withheld) tuples
+    """
+    results = []
+    for vested, sold, paid, price, strike, cash, iso in zip(shares_vested, shares_sold, cash_paid,
+                                                            prices, strikes, is_cash, is_iso):
+        received = vested - sold
+        if cash:
+            results.append((vested, received, paid + sold))
+            continue
+
+        per_share = price - strike if iso else price
+        gross_value = vested * per_share
+        net_value = received * per_share if price else 0.0
+        tax_withheld = paid + sold * price if sold > 0 else paid
+        results.append((gross_value, net_value, tax_withheld))
+    return results
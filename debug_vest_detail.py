@@ -52,17 +52,17 @@ with app.app_context():
             sales_data=None,
             exercises_data=None
         )
-        print(f"SUCCESS! Got vest_data with keys: {list(vest_data.keys())}")
+        print(f"SUCCESS! Got vest_data with fields: {list(vest_data._fields)}")
         
         # Print key values
         print(f"\nKey values:")
-        print(f"  vest_id: {vest_data.get('vest_id')}")
-        print(f"  has_vested: {vest_data.get('has_vested')}")
-        print(f"  is_iso: {vest_data.get('is_iso')}")
-        print(f"  shares_vested: {vest_data.get('shares_vested')}")
-        print(f"  price_at_vest: {vest_data.get('price_at_vest')}")
-        print(f"  current_price: {vest_data.get('current_price')}")
-        print(f"  error: {vest_data.get('error')}")
+        print(f"  vest_id: {vest_data.vest_id}")
+        print(f"  has_vested: {vest_data.has_vested}")
+        print(f"  is_iso: {vest_data.is_iso}")
+        print(f"  shares_vested: {vest_data.shares_vested}")
+        print(f"  price_at_vest: {vest_data.price_at_vest}")
+        print(f"  current_price: {vest_data.current_price}")
+        print(f"  error: {vest_data.error}")
         
     except Exception as e:
         print(f"ERROR calling get_complete_data: {e}")
@@ -97,9 +97,9 @@ with app.app_context():
             sales_data=sales,
             exercises_data=exercises
         )
-        print(f"SUCCESS with full params! Keys: {list(vest_data.keys())}")
-        if 'error' in vest_data:
-            print(f"ERROR in vest_data: {vest_data['error']}")
+        print(f"SUCCESS with full params! Fields: {list(vest_data._fields)}")
+        if vest_data.error:
+            print(f"ERROR in vest_data: {vest_data.error}")
         
     except Exception as e:
         print(f"ERROR in route simulation: {e}")
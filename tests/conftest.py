@@ -0,0 +1,69 @@
+"""
+Shared fixtures for model-level tests.
+
+Builds transient User / Grant / VestEvent objects (never added to a
+session), so the pure calculation paths can be exercised without a database.
+"""
+
+from datetime import date
+
+import pytest
+
+# Register every mapped class so relationship strings resolve
+import app.models  # noqa: F401
+import app.models.annual_income  # noqa: F401
+import app.models.tax_rate  # noqa: F401
+import app.models.user_price  # noqa: F401
+from app.models.grant import Grant, GrantType, ShareType
+from app.models.user import User
+from app.models.vest_event import VestEvent
+
+
+@pytest.fixture
+def make_user():
+    """Factory for a transient user with explicit tax preferences."""
+    def _make_user(federal=0.32, state=0.093, include_fica=True, ss_wage_base_maxed=False):
+        return User(
+            username='tester', email='tester@example.com', password_hash='x',
+            federal_tax_rate=federal, state_tax_rate=state,
+            include_fica=include_fica, ss_wage_base_maxed=ss_wage_base_maxed
+        )
+    return _make_user
+
+
+@pytest.fixture
+def make_grant(make_user):
+    """Factory for a transient grant owned by ``user`` (a fresh one by default)."""
+    def _make_grant(share_type=ShareType.RSU.value, grant_type=GrantType.NEW_HIRE.value,
+                    strike=10.0, espp_discount=0.0, user=None):
+        return Grant(
+            user=user or make_user(),
+            grant_date=date(2020, 1, 1),
+            grant_type=grant_type,
+            share_type=share_type,
+            share_quantity=1000.0,
+            share_price_at_grant=strike,
+            vest_years=4,
+            cliff_years=1.0,
+            espp_discount=espp_discount
+        )
+    return _make_grant
+
+
+@pytest.fixture
+def make_vest():
+    """Factory for a transient vest with its price at vest already resolved."""
+    def _make_vest(grant, vest_date, shares_vested=100.0, shares_sold=0.0, cash_paid=0.0,
+                   price_at_vest=50.0):
+        vest = VestEvent(
+            grant=grant,
+            vest_date=vest_date,
+            shares_vested=shares_vested,
+            shares_sold=shares_sold,
+            cash_paid=cash_paid,
+            cash_covered_all=True
+        )
+        # Same per-instance slot preload_prices() fills; keeps the tests off the price lookup
+        vest._pav_cache = price_at_vest
+        return vest
+    return _make_vest
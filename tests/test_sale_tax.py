@@ -0,0 +1,128 @@
+"""
+Tests for the capital gains estimate (VestEvent.get_estimated_sale_tax / tax_math.sale_tax_core).
+"""
+
+from datetime import date, timedelta
+
+import pytest
+
+import app.models.vest_event as vest_event_module
+from app.models.grant import ShareType
+from app.models.vest_event import SaleTaxEstimate
+from app.utils.tax_math import sale_tax_core, LTCG_RATE, NIIT_RATE
+
+
+@pytest.fixture
+def no_price_lookup(monkeypatch):
+    """Fail the test if get_estimated_sale_tax() goes looking for the latest price."""
+    def _fail(*args, **kwargs):
+        raise AssertionError("unexpected price lookup")
+    monkeypatch.setattr(vest_event_module, 'get_latest_user_price', _fail)
+
+
+def _vest_held(make_user, make_grant, make_vest, days_held, price_at_vest=50.0, **grant_kwargs):
+    today = date.today()
+    grant = make_grant(user=make_user(federal=0.32, state=0.093), **grant_kwargs)
+    return make_vest(grant, today - timedelta(days=days_held), shares_vested=100.0,
+                     price_at_vest=price_at_vest), today
+
+
+@pytest.mark.parametrize('days_held, is_long_term', [(364, False), (365, True), (400, True)])
+def test_holding_period_boundary(make_user, make_grant, make_vest, days_held, is_long_term):
+    vest, today = _vest_held(make_user, make_grant, make_vest, days_held)
+
+    estimate = vest.get_estimated_sale_tax(current_stock_price=80.0, today=today)
+
+    gain = 100.0 * (80.0 - 50.0)
+    assert estimate.days_held == days_held
+    assert estimate.is_long_term is is_long_term
+    assert estimate.unrealized_gain == pytest.approx(gain)
+    assert estimate.federal_rate == (LTCG_RATE if is_long_term else 0.32)
+    assert estimate.federal_tax == pytest.approx(gain * estimate.federal_rate)
+    assert estimate.state_tax == pytest.approx(gain * 0.093)
+    assert estimate.niit_tax == pytest.approx(gain * NIIT_RATE)
+    assert estimate.estimated_tax == pytest.approx(
+        estimate.federal_tax + estimate.state_tax + estimate.niit_tax)
+    assert estimate.method == 'simplified'
+
+
+def test_matches_sale_tax_core(make_user, make_grant, make_vest):
+    vest, today = _vest_held(make_user, make_grant, make_vest, 200)
+
+    estimate = vest.get_estimated_sale_tax(current_stock_price=75.0, today=today)
+
+    federal_rate, federal_tax, state_tax, niit_tax = sale_tax_core(
+        estimate.unrealized_gain, False, 0.32, 0.093)
+    assert (estimate.federal_rate, estimate.federal_tax, estimate.state_tax, estimate.niit_tax) == \
+        (federal_rate, federal_tax, state_tax, niit_tax)
+
+
+def test_no_niit_below_proxy_rate():
+    assert sale_tax_core(1000.0, True, 0.22, 0.0)[3] == 0.0
+
+
+def test_iso_cost_basis_is_strike(make_user, make_grant, make_vest):
+    vest, today = _vest_held(make_user, make_grant, make_vest, 500,
+                             share_type=ShareType.ISO_5Y.value, strike=10.0)
+
+    estimate = vest.get_estimated_sale_tax(current_stock_price=80.0, today=today)
+
+    assert estimate.cost_basis_per_share == 10.0
+    assert estimate.unrealized_gain == pytest.approx(100.0 * (80.0 - 10.0))
+
+
+@pytest.mark.parametrize('shares_sold, total_sold, total_exercised', [
+    (100.0, 0, 0),    # everything withheld for taxes
+    (0.0, 60, 40),    # everything sold or exercised since
+])
+def test_zero_shares_held(make_user, make_grant, make_vest, no_price_lookup,
+                          shares_sold, total_sold, total_exercised):
+    grant = make_grant(user=make_user())
+    vest = make_vest(grant, date.today() - timedelta(days=400), shares_vested=100.0,
+                     shares_sold=shares_sold)
+
+    estimate = vest.get_estimated_sale_tax(total_sold=total_sold, total_exercised=total_exercised)
+
+    assert estimate.shares_held == 0
+    assert estimate.current_value == 0.0
+    assert estimate.unrealized_gain == 0.0
+    assert estimate.estimated_tax == 0.0
+    assert estimate.method == 'none'
+
+
+def test_loss_position_owes_no_tax(make_user, make_grant, make_vest):
+    vest, today = _vest_held(make_user, make_grant, make_vest, 400, price_at_vest=80.0)
+
+    estimate = vest.get_estimated_sale_tax(current_stock_price=50.0, today=today)
+
+    assert estimate.unrealized_gain == pytest.approx(100.0 * (50.0 - 80.0))
+    assert estimate.is_long_term is True
+    assert (estimate.estimated_tax, estimate.federal_tax, estimate.state_tax, estimate.niit_tax) == \
+        (0.0, 0.0, 0.0, 0.0)
+    assert estimate.method == 'none'
+
+
+def test_cash_grant_has_no_capital_gains(make_user, make_grant, make_vest, no_price_lookup):
+    grant = make_grant(user=make_user(), share_type=ShareType.CASH.value)
+    vest = make_vest(grant, date.today() - timedelta(days=400), shares_vested=5000.0,
+                     shares_sold=1000.0)
+
+    estimate = vest.get_estimated_sale_tax()
+
+    assert estimate.shares_held == 4000.0
+    assert estimate.unrealized_gain == 0.0
+    assert estimate.method == 'n/a'
+
+
+def test_returns_named_tuple_with_attribute_access(make_user, make_grant, make_vest):
+    vest, today = _vest_held(make_user, make_grant, make_vest, 400)
+
+    estimate = vest.get_estimated_sale_tax(current_stock_price=80.0, today=today)
+
+    # finance_deep_dive and vest_detail.html read these by attribute
+    assert isinstance(estimate, SaleTaxEstimate)
+    for field in SaleTaxEstimate._fields:
+        assert getattr(estimate, field) == estimate._asdict()[field]
+    assert estimate.holding_period == '1y 35d'
+    assert estimate.cost_basis == pytest.approx(estimate.shares_held * estimate.cost_basis_per_share)
+    assert estimate.current_value == pytest.approx(estimate.shares_held * 80.0)
@@ -0,0 +1,114 @@
+"""
+Tests for the vest tax breakdown engine (app.utils.tax_math).
+"""
+
+from datetime import date, timedelta
+
+import pytest
+
+from app.models.vest_event import VestEvent
+from app.utils.tax_math import (
+    tax_breakdown_core, compute_tax_breakdowns,
+    SS_WAGE_BASE, SS_RATE, MEDICARE_RATE, ADDITIONAL_MEDICARE_THRESHOLD, ADDITIONAL_MEDICARE_RATE,
+)
+
+GROSS_VALUES = [-5000.0, 0.0, 50000.0, SS_WAGE_BASE, 250000.0, 1000000.0]
+
+
+def _scalar_columns(gross_values, federal, state, include_fica, maxed):
+    """compute_tax_breakdowns() rebuilt from one tax_breakdown_core() call per event."""
+    columns = {key: [] for key in (
+        'federal_tax', 'state_tax', 'social_security_tax', 'medicare_tax',
+        'additional_medicare_tax', 'social_security_rate', 'medicare_rate',
+        'additional_medicare_rate', 'total_fica', 'total_tax', 'net_value', 'effective_rate')}
+    for gross in gross_values:
+        (fed_tax, state_tax, ss_tax, med_tax, add_med_tax,
+         ss_rate, med_rate, add_med_rate) = tax_breakdown_core(gross, federal, state, include_fica, maxed)
+        total_fica = ss_tax + med_tax + add_med_tax
+        total_tax = fed_tax + state_tax + total_fica
+        for key, value in (('federal_tax', fed_tax), ('state_tax', state_tax),
+                           ('social_security_tax', ss_tax), ('medicare_tax', med_tax),
+                           ('additional_medicare_tax', add_med_tax), ('social_security_rate', ss_rate),
+                           ('medicare_rate', med_rate), ('additional_medicare_rate', add_med_rate),
+                           ('total_fica', total_fica), ('total_tax', total_tax),
+                           ('net_value', gross - total_tax),
+                           ('effective_rate', total_tax / gross if gross > 0 else 0.0)):
+            columns[key].append(value)
+    return columns
+
+
+@pytest.mark.parametrize('include_fica', [True, False])
+@pytest.mark.parametrize('maxed', [True, False])
+def test_batch_matches_scalar(include_fica, maxed):
+    n = len(GROSS_VALUES)
+    batch = compute_tax_breakdowns(GROSS_VALUES, [0.32] * n, [0.093] * n,
+                                   [include_fica] * n, [maxed] * n)
+    assert batch == _scalar_columns(GROSS_VALUES, 0.32, 0.093, include_fica, maxed)
+
+
+def test_batch_handles_mixed_preferences_per_row():
+    gross = [100000.0, 300000.0, 20000.0]
+    federal = [0.22, 0.35, 0.12]
+    state = [0.0, 0.093, 0.05]
+    fica = [True, True, False]
+    maxed = [False, True, False]
+    batch = compute_tax_breakdowns(gross, federal, state, fica, maxed)
+    for row in range(len(gross)):
+        expected = _scalar_columns([gross[row]], federal[row], state[row], fica[row], maxed[row])
+        assert {key: values[row] for key, values in batch.items()} == \
+            {key: values[0] for key, values in expected.items()}
+
+
+def test_social_security_capped_at_wage_base():
+    ss_tax = tax_breakdown_core(250000.0, 0.32, 0.0, True, False)[2]
+    assert ss_tax == pytest.approx(SS_WAGE_BASE * SS_RATE)
+
+    ss_tax = tax_breakdown_core(100000.0, 0.32, 0.0, True, False)[2]
+    assert ss_tax == pytest.approx(100000.0 * SS_RATE)
+
+
+def test_additional_medicare_only_above_threshold():
+    below = tax_breakdown_core(ADDITIONAL_MEDICARE_THRESHOLD, 0.22, 0.0, True, False)
+    assert below[4] == 0.0
+    assert below[7] == 0.0
+
+    above = tax_breakdown_core(ADDITIONAL_MEDICARE_THRESHOLD + 10000.0, 0.22, 0.0, True, False)
+    assert above[4] == pytest.approx(10000.0 * ADDITIONAL_MEDICARE_RATE)
+    assert above[7] == ADDITIONAL_MEDICARE_RATE
+
+
+def test_include_fica_false_zeroes_every_fica_component():
+    result = tax_breakdown_core(500000.0, 0.32, 0.093, False, False)
+    assert result[:2] == pytest.approx((500000.0 * 0.32, 500000.0 * 0.093))
+    assert result[2:] == (0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+
+
+def test_ss_wage_base_maxed_skips_social_security_only():
+    (_, _, ss_tax, medicare_tax, _, ss_rate, medicare_rate, _) = tax_breakdown_core(
+        100000.0, 0.22, 0.0, True, True)
+    assert ss_tax == 0.0
+    assert ss_rate == 0.0
+    assert medicare_tax == pytest.approx(100000.0 * MEDICARE_RATE)
+    assert medicare_rate == MEDICARE_RATE
+
+
+@pytest.mark.parametrize('gross', [0.0, -5000.0])
+def test_zero_or_negative_gross(gross):
+    batch = compute_tax_breakdowns([gross], [0.32], [0.093], [True], [False])
+    assert batch['effective_rate'] == [0.0]
+    assert batch['additional_medicare_tax'] == [0.0]
+    assert batch['additional_medicare_rate'] == [0.0]
+    assert batch['net_value'][0] == pytest.approx(gross - batch['total_tax'][0])
+
+
+@pytest.mark.parametrize('include_fica', [True, False])
+@pytest.mark.parametrize('maxed', [True, False])
+def test_bulk_breakdowns_match_per_vest_breakdowns(make_user, make_grant, make_vest, include_fica, maxed):
+    user = make_user(include_fica=include_fica, ss_wage_base_maxed=maxed)
+    grant = make_grant(user=user)
+    past = date.today() - timedelta(days=30)
+    events = [make_vest(grant, past, shares_vested=shares, price_at_vest=price)
+              for shares, price in ((100.0, 50.0), (5000.0, 80.0), (10.0, 0.0))]
+
+    bulk = VestEvent.bulk_tax_breakdowns(events)
+    assert bulk == [event.get_comprehensive_tax_breakdown() for event in events]
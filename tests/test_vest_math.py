@@ -0,0 +1,73 @@
+"""
+Tests for batch vest values (app.utils.vest_math / VestEvent.preload_values).
+"""
+
+from datetime import date, timedelta
+
+import pytest
+
+from app.models.grant import GrantType, ShareType
+from app.models.vest_event import VestEvent
+from app.utils.vest_math import compute_vest_values
+
+GRANT_KINDS = {
+    'rsu': dict(share_type=ShareType.RSU.value, grant_type=GrantType.NEW_HIRE.value),
+    'iso_5y': dict(share_type=ShareType.ISO_5Y.value, grant_type=GrantType.NEW_HIRE.value, strike=12.5),
+    'iso_6y': dict(share_type=ShareType.ISO_6Y.value, grant_type=GrantType.PROMOTION.value, strike=60.0),
+    # No NSO share type exists; unlisted share types take the full-value path
+    'nso': dict(share_type='nso', grant_type=GrantType.ANNUAL_PERFORMANCE.value, strike=12.5),
+    'espp': dict(share_type=ShareType.RSU.value, grant_type=GrantType.ESPP.value, espp_discount=0.15),
+    'nqespp': dict(share_type=ShareType.RSU.value, grant_type=GrantType.NQESPP.value, espp_discount=0.15),
+    'cash': dict(share_type=ShareType.CASH.value, grant_type=GrantType.NEW_HIRE.value),
+}
+
+# (days from today, shares_vested, shares_sold, cash_paid, price_at_vest)
+VEST_CASES = [
+    (-400, 100.0, 0.0, 0.0, 50.0),       # vested, no tax info yet
+    (-30, 100.0, 30.0, 250.0, 45.5),     # vested, shares sold + cash paid
+    (-10, 100.0, 0.0, 1200.0, 0.0),      # vested, no price on file
+    (90, 250.0, 0.0, 0.0, 48.0),         # future vest, estimated at latest price
+]
+
+
+def _make_events(make_grant, make_vest, kind):
+    grant = make_grant(**GRANT_KINDS[kind])
+    today = date.today()
+    return [make_vest(grant, today + timedelta(days=offset), shares_vested=vested,
+                      shares_sold=sold, cash_paid=paid, price_at_vest=price)
+            for offset, vested, sold, paid, price in VEST_CASES]
+
+
+@pytest.mark.parametrize('kind', sorted(GRANT_KINDS))
+def test_preloaded_values_match_compute_values(make_grant, make_vest, kind):
+    events = _make_events(make_grant, make_vest, kind)
+    expected = [event._compute_values() for event in events]
+
+    VestEvent.preload_values(events)
+
+    for event, values in zip(events, expected):
+        assert event._values_cache == pytest.approx(values)
+        assert (event.value_at_vest, event.net_value, event.tax_withheld) == pytest.approx(values)
+
+
+def test_preload_values_keeps_persisted_value_at_vest(make_grant, make_vest):
+    grant = make_grant(**GRANT_KINDS['rsu'])
+    event = make_vest(grant, date.today() - timedelta(days=400), price_at_vest=50.0)
+    event.price_at_vest_cached = 50.0
+    event.value_at_vest_cached = 4321.0
+
+    expected = event._compute_values()
+    VestEvent.preload_values([event])
+
+    assert expected[0] == 4321.0
+    assert event._values_cache == pytest.approx(expected)
+
+
+def test_cash_values_ignore_price_and_strike():
+    values = compute_vest_values([5000.0], [1000.0], [200.0], [99.0], [10.0], [True], [False])
+    assert values == [(5000.0, 4000.0, 1200.0)]
+
+
+def test_iso_values_use_spread():
+    values = compute_vest_values([100.0], [10.0], [0.0], [50.0], [20.0], [False], [True])
+    assert values == [(100.0 * 30.0, 90.0 * 30.0, 10.0 * 50.0)]